@@ -1,8 +1,12 @@
 """Module HTTP communication with the Netatmo API."""
 
 from .auth import AuthClient, auth_client
+from .cache import ResponseCache
+from .diff import ChangeEvent, ChangeType, SnapshotDiffer, diff_devices
 from .errors import (
     ApiException,
+    CircuitBreakerOpenException,
+    DeadlineExceededException,
     NonOkResponseException,
     NetworkException,
     NetworkTimeoutException,
@@ -12,9 +16,20 @@ from .errors import (
     RequestException,
     RequestServerException,
     RequestUnauthorizedException,
+    ResponseDecodeException,
     RetryableException,
     UnsuportedArgumentsException,
 )
+from .fleet import FleetClient, FleetResult
+from .measure_encoding import decode_measurement_items, encode_measurement_items, read_measurement_items, write_measurement_items
+from .measure_index import MeasurementIndex
+from .measure_plan import MeasurePlan, plan_measure
+from .measure_store import MeasurementStore
+from .pool import ClientPool
+from .rate_limit import RateLimit, RateLimiter
+from .resample import Aggregation, resample
+from .retry import CircuitBreaker, CircuitState, RetryBudget, RetryPolicy
+from .simulation import simulate_module_setpoints, simulate_setpoints
 from .thermostat import (
     Device,
     Measured,
@@ -36,7 +51,20 @@ from .token import Token, TokenStore
 __all__ = [
     "AuthClient",
     "ThermostatClient",
+    "FleetClient",
+    "ClientPool",
+    "ResponseCache",
+    "RateLimiter",
+    "RateLimit",
+    "RetryPolicy",
+    "RetryBudget",
+    "CircuitBreaker",
+    "MeasurementStore",
+    "MeasurementIndex",
+    "SnapshotDiffer",
     "ApiException",
+    "CircuitBreakerOpenException",
+    "DeadlineExceededException",
     "NonOkResponseException",
     "NetworkException",
     "NetworkTimeoutException",
@@ -46,6 +74,7 @@ __all__ = [
     "RequestException",
     "RequestServerException",
     "RequestUnauthorizedException",
+    "ResponseDecodeException",
     "RetryableException",
     "UnsuportedArgumentsException",
     "Device",
@@ -56,12 +85,27 @@ __all__ = [
     "Setpoint",
     "Measured",
     "MeasurementItem",
+    "FleetResult",
+    "MeasurePlan",
+    "ChangeEvent",
     "MeasurementType",
     "MeasurementScale",
     "SystemMode",
     "SetpointMode",
+    "CircuitState",
+    "Aggregation",
+    "ChangeType",
     "Token",
     "TokenStore",
     "auth_client",
     "thermostat_client",
+    "encode_measurement_items",
+    "decode_measurement_items",
+    "read_measurement_items",
+    "write_measurement_items",
+    "resample",
+    "plan_measure",
+    "simulate_setpoints",
+    "simulate_module_setpoints",
+    "diff_devices",
 ]
@@ -5,9 +5,11 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Callable
 
-from httpx import AsyncClient
+from httpx import AsyncClient, Timeout
 
-from .base import BaseClient
+from .base import BaseClient, JsonDecoder
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
 from .token import Token, TokenStore
 
 _TOKEN_PATH = "oauth2/token"
@@ -18,8 +20,17 @@ async def auth_client(
     client_id: str,
     client_secret: str,
     on_token_update: Callable[[Token], None],
+    client: AsyncClient | None = None,
 ) -> AsyncGenerator[AuthClient, None]:
-    client = AsyncClient()
+    """
+    Create new auth client for the duration of the context.
+
+    If client is provided (ie. from a shared ClientPool), it is used for making requests and is not closed when the context exits.
+    """
+
+    owns_client = client is None
+    if owns_client:
+        client = AsyncClient()
     token_store = TokenStore(client_id, client_secret, None, on_token_update)
     
     c = AuthClient(client, token_store)
@@ -27,7 +38,8 @@ async def auth_client(
     try:
         yield c
     finally:
-        await client.aclose()
+        if owns_client:
+            await client.aclose()
 
 class AuthClient(BaseClient):
     """
@@ -40,6 +52,10 @@ class AuthClient(BaseClient):
         self,
         client: AsyncClient,
         token_store: TokenStore,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        timeouts: dict[str, Timeout] | None = None,
+        json_decoder: JsonDecoder | None = None,
     ) -> None:
         """
         Create new auth client instance.
@@ -48,7 +64,7 @@ class AuthClient(BaseClient):
         """
 
         self._token_store = token_store
-        super().__init__(client, None)
+        super().__init__(client, None, rate_limiter, retry_policy, timeouts, json_decoder)
 
     async def async_token(
         self,
@@ -56,10 +72,13 @@ class AuthClient(BaseClient):
         password: str,
         user_prefix: str,
         app_version: str,
+        deadline: float | None = None,
     ) -> None:
         """
         Get the access and refresh tokens from the Netatmo API which can be used for making requests towards all other protected APIs. Uses the resource owner password credentials grant, with custom Vaillant parameters - user prefix and app version.
 
+        If deadline is provided, the call including all the retries has to finish in deadline seconds.
+
         On success, returns nothing. On error, throws an exception.
         """
 
@@ -74,6 +93,7 @@ class AuthClient(BaseClient):
         body = await self._post(
             _TOKEN_PATH,
             data=data,
+            deadline=deadline,
         )
 
         self._token_store.token = Token(body)
\ No newline at end of file
@@ -2,12 +2,47 @@
 
 from __future__ import annotations
 
-from httpx import AsyncClient, Auth
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, stop_after_delay, wait_random_exponential
+import asyncio
+import json
 
-from .errors import RetryableException, client_error_handler
+from time import monotonic
+from typing import Any, Callable
 
-_API_HOST = "https://api.netatmo.com/"
+from httpx import AsyncClient, Auth, Timeout
+
+from .errors import DeadlineExceededException, RequestBackoffException, ResponseDecodeException, client_error_handler
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+
+# Base URL of all the API requests.
+API_HOST = "https://api.netatmo.com/"
+_DEFAULT_TIMEOUT = Timeout(15.0)
+
+JsonDecoder = Callable[[bytes], Any]
+
+
+def get_default_json_decoder() -> JsonDecoder:
+    """
+    Returns the fastest available JSON decoder.
+
+    Uses orjson or msgspec if one of them is installed (ie. with the orjson or msgspec extra of this library), and the standard library decoder otherwise.
+    """
+
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+
+        return msgspec.json.decode
+    except ImportError:
+        pass
+
+    return json.loads
 
 
 class BaseClient:
@@ -21,36 +56,114 @@ class BaseClient:
         self,
         client: AsyncClient,
         auth: Auth,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        timeouts: dict[str, Timeout] | None = None,
+        json_decoder: JsonDecoder | None = None,
     ) -> None:
         """
         Create new base client instance.
 
         Uses the provided parameters when making API calls towards the Netatmo API.
+        When rate limiter is provided, requests wait for the available budget before being sent.
+        When retry policy is not provided, requests are retried for up to 10 times or 5 minutes.
+        Timeouts can be provided per API path (ie. "api/getmeasure"), all other paths use the default timeout of 15s.
+        JSON decoder is called with the raw response body, when it is not provided the fastest available decoder is used.
         """
 
         self._client = client
         self._auth = auth
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._timeouts = timeouts if timeouts is not None else {}
+        self._json_decoder = json_decoder if json_decoder is not None else _DEFAULT_JSON_DECODER
 
-    @retry(
-        retry=retry_if_exception_type(RetryableException),
-        stop=(stop_after_delay(300) | stop_after_attempt(10)),
-        wait=wait_random_exponential(multiplier=1, max=30),
-        reraise=True,
-    )
-    async def _post(self, path: str, data: dict) -> dict:
+    async def _post(self, path: str, data: dict, deadline: float | None = None, decoder: JsonDecoder | None = None) -> Any:
         """
-        Makes post request using the underlying httpx AsyncClient, with the defaut timeout of 15s.
+        Makes post request using the underlying httpx AsyncClient, with the timeout configured for the path.
         
-        In case of retryable exceptions, requests are retryed for up to 10 times or 5 minutes.
+        In case of retryable exceptions, requests are retryed according to the retry policy.
+        If deadline is provided, the whole call including all the retries has to finish in deadline seconds.
+        If decoder is provided, it decodes the response content instead of the JSON decoder of the client.
         """
 
+        body, _ = await self._post_with_content(path, data, deadline, decoder)
+
+        return body
+
+    async def _post_with_content(self, path: str, data: dict, deadline: float | None = None, decoder: JsonDecoder | None = None) -> tuple[Any, bytes]:
+        """Makes post request the same way as _post. Returns both the decoded response body and the raw response content."""
+
+        expires_at = None if deadline is None else monotonic() + deadline
+        decoder = decoder if decoder is not None else self._json_decoder
+
+        return await self._retry_policy.call(lambda: self._post_once(path, data, expires_at, decoder), expires_at)
+
+    async def _post_once(self, path: str, data: dict, expires_at: float | None, decoder: JsonDecoder) -> tuple[Any, bytes]:
+        if self._rate_limiter is not None:
+            if expires_at is None:
+                await self._rate_limiter.acquire()
+            else:
+                try:
+                    await asyncio.wait_for(self._rate_limiter.acquire(), max(0.0, expires_at - monotonic()))
+                except asyncio.TimeoutError as e:
+                    raise DeadlineExceededException("Deadline passed while waiting for the rate limiter. Retry the request with longer deadline.", path=path) from e
+
+        timeout = self._get_timeout(path, expires_at)
+
+        try:
+            if expires_at is None:
+                return await self._send(path, data, timeout, decoder)
+
+            # Timeouts only bound each phase of the request on its own, and the auth flow can send a token refresh as well, so the whole attempt is bounded too.
+            try:
+                return await asyncio.wait_for(self._send(path, data, timeout, decoder), max(0.0, expires_at - monotonic()))
+            except asyncio.TimeoutError as e:
+                raise DeadlineExceededException("Deadline passed while waiting for the response. Retry the request with longer deadline.", path=path) from e
+        except RequestBackoffException:
+            if self._rate_limiter is not None:
+                self._rate_limiter.drain()
+            raise
+
+    def _get_timeout(self, path: str, expires_at: float | None) -> Timeout:
+        timeout = self._timeouts.get(path, _DEFAULT_TIMEOUT)
+        if expires_at is None:
+            return timeout
+
+        remaining = expires_at - monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededException("Deadline passed before the request could be sent. Retry the request with longer deadline.", path=path)
+
+        return Timeout(
+            connect=_clamp(timeout.connect, remaining),
+            read=_clamp(timeout.read, remaining),
+            write=_clamp(timeout.write, remaining),
+            pool=_clamp(timeout.pool, remaining),
+        )
+
+    async def _send(self, path: str, data: dict, timeout: Timeout, decoder: JsonDecoder) -> tuple[Any, bytes]:
         with client_error_handler():
             resp = await self._client.post(
-                f"{_API_HOST}{path}",
+                f"{API_HOST}{path}",
                 data=data,
                 auth=self._auth,
-                timeout=15.0,
+                timeout=timeout,
             )
 
             resp.raise_for_status()
-            return resp.json()
\ No newline at end of file
+
+        # Decoders raise different exceptions (ie. msgspec.DecodeError is not a ValueError), so all of them are wrapped into one.
+        try:
+            return decoder(resp.content), resp.content
+        except Exception as e:
+            raise ResponseDecodeException("Response content couldn't be decoded. Check the log for more details.", resp.request, resp) from e
+
+
+_DEFAULT_JSON_DECODER = get_default_json_decoder()
+
+
+def _clamp(timeout: float | None, remaining: float) -> float:
+    if timeout is None:
+        return remaining
+
+    return min(timeout, remaining)
@@ -0,0 +1,89 @@
+"""Module containing a read cache for the Netatmo API responses."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable, Iterable
+
+_DEFAULT_TTL_SECONDS = 60.0
+_DEFAULT_MAX_SIZE = 128
+
+
+class ResponseCache:
+    """
+    In-memory cache with time based expiration and least recently used eviction.
+
+    Entries can be tagged (ie. with device ids), which allows invalidating all entries related to a tag after a write.
+    Any object implementing the same methods can be provided to the clients instead of this implementation.
+    """
+
+    def __init__(
+        self,
+        ttl: float = _DEFAULT_TTL_SECONDS,
+        max_size: int = _DEFAULT_MAX_SIZE,
+    ) -> None:
+        """
+        Create new response cache instance.
+
+        Entries expire after ttl seconds and the least recently used entries are evicted when there are more than max size entries.
+        """
+
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, tuple[float, Any, frozenset]] = OrderedDict()
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Returns a counter which is incremented on every invalidation. Used to avoid caching responses which were fetched before a write."""
+
+        return self._generation
+
+    def get(self, key: Hashable) -> Any | None:
+        """Returns a cached value for the key, or None if there is no value or the value is expired."""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value, _ = entry
+        if expires_at <= monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[str] = (), generation: int | None = None) -> None:
+        """
+        Stores a value for the key, tagged with the provided tags.
+
+        If generation is provided and the cache was invalidated in the meantime, the value is not stored.
+        """
+
+        if generation is not None and generation != self._generation:
+            return
+
+        self._entries[key] = (monotonic() + self._ttl, value, frozenset(tags))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, tag: str) -> None:
+        """Removes all the entries tagged with the provided tag."""
+
+        self._generation += 1
+
+        for key in [key for key, (_, _, tags) in self._entries.items() if tag in tags]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Removes all the entries."""
+
+        self._generation += 1
+        self._entries.clear()
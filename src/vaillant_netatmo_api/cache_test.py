@@ -0,0 +1,64 @@
+import pytest
+
+from pytest_mock import MockerFixture
+
+from vaillant_netatmo_api.cache import ResponseCache
+
+
+@pytest.mark.asyncio
+class TestResponseCache:
+    async def test_get__missing_key__returns_none(self):
+        cache = ResponseCache()
+
+        assert cache.get("key") is None
+
+    async def test_get__non_expired_key__returns_value(self, mocker: MockerFixture):
+        mocker.patch("vaillant_netatmo_api.cache.monotonic", return_value=100)
+        cache = ResponseCache(ttl=30)
+        cache.set("key", "value")
+
+        mocker.patch("vaillant_netatmo_api.cache.monotonic", return_value=129)
+
+        assert cache.get("key") == "value"
+
+    async def test_get__expired_key__returns_none(self, mocker: MockerFixture):
+        mocker.patch("vaillant_netatmo_api.cache.monotonic", return_value=100)
+        cache = ResponseCache(ttl=30)
+        cache.set("key", "value")
+
+        mocker.patch("vaillant_netatmo_api.cache.monotonic", return_value=130)
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    async def test_set__more_keys_than_max_size__evicts_least_recently_used(self):
+        cache = ResponseCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    async def test_set__stale_generation__doesnt_store_value(self):
+        cache = ResponseCache()
+        generation = cache.generation
+        cache.invalidate("device")
+
+        cache.set("key", "value", ["device"], generation)
+
+        assert cache.get("key") is None
+
+    async def test_invalidate__tagged_keys__removes_only_tagged_keys(self):
+        cache = ResponseCache()
+        cache.set("a", 1, ["device1"])
+        cache.set("b", 2, ["device1", "device2"])
+        cache.set("c", 3, ["device3"])
+
+        cache.invalidate("device1")
+
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
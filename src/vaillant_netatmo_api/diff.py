@@ -0,0 +1,212 @@
+"""Module containing change detection between consecutive snapshots of thermostat data."""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any
+
+from .thermostat import Device, Module, Setpoint
+
+
+class ChangeType(Enum):
+    """ChangeType enumeration representing possible changes between two snapshots of thermostat data."""
+
+    DEVICE_ADDED = "device_added"
+    DEVICE_REMOVED = "device_removed"
+    MODULE_ADDED = "module_added"
+    MODULE_REMOVED = "module_removed"
+    SYSTEM_MODE = "system_mode"
+    TEMPERATURE = "temperature"
+    SETPOINT_TEMPERATURE = "setpoint_temperature"
+    SETPOINT_ACTIVATED = "setpoint_activated"
+    SETPOINT_EXPIRED = "setpoint_expired"
+    BATTERY_DROP = "battery_drop"
+    RF_DROP = "rf_drop"
+    SCHEDULE = "schedule"
+
+
+class ChangeEvent:
+    """ChangeEvent model representing one change between two snapshots of thermostat data."""
+
+    def __init__(
+        self,
+        type: ChangeType,
+        device_id: str | None,
+        module_id: str | None = None,
+        old: Any = None,
+        new: Any = None,
+        setpoint: str | None = None,
+    ) -> None:
+        """Create new change event model. For setpoint changes, setpoint is the name of the changed setpoint (ie. "setpoint_manual")."""
+
+        self.type = type
+        self.device_id = device_id
+        self.module_id = module_id
+        self.old = old
+        self.new = new
+        self.setpoint = setpoint
+
+    def __eq__(self, other: ChangeEvent):
+        if not isinstance(other, ChangeEvent):
+            return False
+
+        return (
+            self.type == other.type
+            and self.device_id == other.device_id
+            and self.module_id == other.module_id
+            and self.old == other.old
+            and self.new == other.new
+            and self.setpoint == other.setpoint
+        )
+
+
+class SnapshotDiffer:
+    """
+    Change detector for consecutive snapshots of thermostat data, ie. from polling async_get_thermostats_data.
+
+    Each device and module of a snapshot is fingerprinted once, and only the devices and modules with a changed fingerprint are compared field by field.
+    Fingerprints are tuples of the compared fields, not hashes, so values with equal hashes (ie. -1.0 and -2.0) can't hide a change.
+    The fingerprints of the previous snapshot are kept, so each poll only fingerprints the new snapshot. Programs of modules created with lazy hydration
+    are fingerprinted from the API response, without building their models.
+    """
+
+    def __init__(self) -> None:
+        """Create new snapshot differ instance, without a previous snapshot."""
+
+        self._previous: dict[str, _DeviceState] | None = None
+
+    def diff(self, devices: list[Device]) -> list[ChangeEvent]:
+        """
+        Returns changes between the previous snapshot and the provided devices, which become the previous snapshot for the next call.
+
+        The first call only records the snapshot and returns no changes.
+        """
+
+        current = _get_snapshot(devices)
+        previous = self._previous
+        self._previous = current
+
+        if previous is None:
+            return []
+
+        return _diff_snapshots(previous, current)
+
+    def reset(self) -> None:
+        """Drops the previous snapshot."""
+
+        self._previous = None
+
+
+def diff_devices(old: list[Device], new: list[Device]) -> list[ChangeEvent]:
+    """Returns changes between two snapshots of thermostat data."""
+
+    return _diff_snapshots(_get_snapshot(old), _get_snapshot(new))
+
+
+class _ModuleState:
+    __slots__ = ("module", "schedule", "fingerprint")
+
+    def __init__(self, module: Module) -> None:
+        self.module = module
+        self.schedule = module.schedule_fingerprint()
+        self.fingerprint = (
+            module.measured.temperature,
+            module.measured.setpoint_temp,
+            module.battery_percent,
+            module.rf_status,
+            _get_setpoint_fingerprint(module.setpoint_manual),
+            _get_setpoint_fingerprint(module.setpoint_away),
+            self.schedule,
+        )
+
+
+class _DeviceState:
+    __slots__ = ("device", "modules", "fingerprint")
+
+    def __init__(self, device: Device) -> None:
+        self.device = device
+        self.modules = {module.id: _ModuleState(module) for module in device.modules}
+        self.fingerprint = (
+            device.system_mode,
+            _get_setpoint_fingerprint(device.setpoint_hwb),
+            tuple([(module_id, state.fingerprint) for module_id, state in self.modules.items()]),
+        )
+
+
+def _get_snapshot(devices: list[Device]) -> dict[str, _DeviceState]:
+    return {device.id: _DeviceState(device) for device in devices}
+
+
+def _get_setpoint_fingerprint(setpoint: Setpoint) -> tuple:
+    return setpoint.setpoint_activate, setpoint.setpoint_endtime, setpoint.setpoint_temp
+
+
+def _diff_snapshots(previous: dict[str, _DeviceState], current: dict[str, _DeviceState]) -> list[ChangeEvent]:
+    events = []
+
+    for device_id, state in current.items():
+        old_state = previous.get(device_id)
+        if old_state is None:
+            events.append(ChangeEvent(ChangeType.DEVICE_ADDED, device_id))
+        elif old_state.fingerprint != state.fingerprint:
+            _diff_devices(events, old_state, state)
+
+    for device_id in previous:
+        if device_id not in current:
+            events.append(ChangeEvent(ChangeType.DEVICE_REMOVED, device_id))
+
+    return events
+
+
+def _diff_devices(events: list[ChangeEvent], old_state: _DeviceState, state: _DeviceState) -> None:
+    old, new = old_state.device, state.device
+
+    if old.system_mode != new.system_mode:
+        events.append(ChangeEvent(ChangeType.SYSTEM_MODE, new.id, old=old.system_mode, new=new.system_mode))
+
+    _diff_setpoints(events, new.id, None, "setpoint_hwb", old.setpoint_hwb, new.setpoint_hwb)
+
+    for module_id, module_state in state.modules.items():
+        old_module_state = old_state.modules.get(module_id)
+        if old_module_state is None:
+            events.append(ChangeEvent(ChangeType.MODULE_ADDED, new.id, module_id))
+        elif old_module_state.fingerprint != module_state.fingerprint:
+            _diff_modules(events, new.id, old_module_state, module_state)
+
+    for module_id in old_state.modules:
+        if module_id not in state.modules:
+            events.append(ChangeEvent(ChangeType.MODULE_REMOVED, new.id, module_id))
+
+
+def _diff_modules(events: list[ChangeEvent], device_id: str, old_state: _ModuleState, state: _ModuleState) -> None:
+    old, new = old_state.module, state.module
+
+    if old.measured.temperature != new.measured.temperature:
+        events.append(ChangeEvent(ChangeType.TEMPERATURE, device_id, new.id, old.measured.temperature, new.measured.temperature))
+
+    if old.measured.setpoint_temp != new.measured.setpoint_temp:
+        events.append(ChangeEvent(ChangeType.SETPOINT_TEMPERATURE, device_id, new.id, old.measured.setpoint_temp, new.measured.setpoint_temp))
+
+    _diff_setpoints(events, device_id, new.id, "setpoint_manual", old.setpoint_manual, new.setpoint_manual)
+    _diff_setpoints(events, device_id, new.id, "setpoint_away", old.setpoint_away, new.setpoint_away)
+
+    # The API can report battery and RF status as null, and a drop can't be told from missing values.
+    if new.battery_percent is not None and old.battery_percent is not None and new.battery_percent < old.battery_percent:
+        events.append(ChangeEvent(ChangeType.BATTERY_DROP, device_id, new.id, old.battery_percent, new.battery_percent))
+
+    # RF status is reported as signal attenuation, so higher values mean weaker signal.
+    if new.rf_status is not None and old.rf_status is not None and new.rf_status > old.rf_status:
+        events.append(ChangeEvent(ChangeType.RF_DROP, device_id, new.id, old.rf_status, new.rf_status))
+
+    if old_state.schedule != state.schedule:
+        events.append(ChangeEvent(ChangeType.SCHEDULE, device_id, new.id))
+
+
+def _diff_setpoints(events: list[ChangeEvent], device_id: str, module_id: str | None, name: str, old: Setpoint, new: Setpoint) -> None:
+    if _get_setpoint_fingerprint(old) == _get_setpoint_fingerprint(new):
+        return
+
+    if new.setpoint_activate:
+        events.append(ChangeEvent(ChangeType.SETPOINT_ACTIVATED, device_id, module_id, old.setpoint_endtime, new.setpoint_endtime, name))
+    elif old.setpoint_activate:
+        events.append(ChangeEvent(ChangeType.SETPOINT_EXPIRED, device_id, module_id, old.setpoint_endtime, new.setpoint_endtime, name))
@@ -0,0 +1,151 @@
+import pytest
+
+from copy import deepcopy
+
+from vaillant_netatmo_api.diff import ChangeEvent, ChangeType, SnapshotDiffer, diff_devices
+from vaillant_netatmo_api.thermostat import Device, SystemMode
+
+device = {
+    "_id": "device",
+    "system_mode": "winter",
+    "setpoint_hwb": {"setpoint_activate": False},
+    "modules": [
+        {
+            "_id": "module",
+            "rf_status": 60,
+            "battery_percent": 80,
+            "setpoint_away": {"setpoint_activate": False},
+            "setpoint_manual": {"setpoint_activate": False},
+            "therm_program_list": [
+                {
+                    "program_id": "program",
+                    "zones": [{"id": 0, "temp": 20}],
+                    "timetable": [{"id": 0, "m_offset": 0}],
+                    "selected": True,
+                }
+            ],
+            "measured": {"temperature": 21, "setpoint_temp": 20},
+        }
+    ],
+}
+
+
+def changed_device(change) -> Device:
+    data = deepcopy(device)
+    change(data)
+    return Device(**data)
+
+
+@pytest.mark.asyncio
+class TestDiff:
+    async def test_diff_devices__same_snapshots__returns_no_changes(self):
+        assert diff_devices([Device(**device)], [Device(**device)]) == []
+
+    async def test_diff_devices__changed_measurements__returns_temperature_changes(self):
+        def change(data):
+            data["modules"][0]["measured"] = {"temperature": 22, "setpoint_temp": 23}
+
+        changes = diff_devices([Device(**device)], [changed_device(change)])
+
+        assert changes == [
+            ChangeEvent(ChangeType.TEMPERATURE, "device", "module", 21, 22),
+            ChangeEvent(ChangeType.SETPOINT_TEMPERATURE, "device", "module", 20, 23),
+        ]
+
+    async def test_diff_devices__temperatures_with_equal_hashes__returns_temperature_change(self):
+        def old_change(data):
+            data["modules"][0]["measured"]["temperature"] = -1.0
+
+        def new_change(data):
+            data["modules"][0]["measured"]["temperature"] = -2.0
+
+        changes = diff_devices([changed_device(old_change)], [changed_device(new_change)])
+
+        assert changes == [ChangeEvent(ChangeType.TEMPERATURE, "device", "module", -1.0, -2.0)]
+
+    async def test_diff_devices__changed_system_mode_and_setpoints__returns_mode_and_setpoint_changes(self):
+        def activate(data):
+            data["system_mode"] = "summer"
+            data["setpoint_hwb"] = {"setpoint_activate": True}
+            data["modules"][0]["setpoint_manual"] = {"setpoint_activate": True, "setpoint_endtime": 1642056298, "setpoint_temp": 25}
+
+        active = changed_device(activate)
+
+        assert diff_devices([Device(**device)], [active]) == [
+            ChangeEvent(ChangeType.SYSTEM_MODE, "device", old=SystemMode.WINTER, new=SystemMode.SUMMER),
+            ChangeEvent(ChangeType.SETPOINT_ACTIVATED, "device", setpoint="setpoint_hwb"),
+            ChangeEvent(ChangeType.SETPOINT_ACTIVATED, "device", "module", None, active.modules[0].setpoint_manual.setpoint_endtime, "setpoint_manual"),
+        ]
+        assert diff_devices([active], [changed_device(lambda data: data.update(system_mode="summer"))]) == [
+            ChangeEvent(ChangeType.SETPOINT_EXPIRED, "device", setpoint="setpoint_hwb"),
+            ChangeEvent(ChangeType.SETPOINT_EXPIRED, "device", "module", active.modules[0].setpoint_manual.setpoint_endtime, None, "setpoint_manual"),
+        ]
+
+    async def test_diff_devices__weaker_battery_and_signal__returns_drops(self):
+        def change(data):
+            data["modules"][0]["battery_percent"] = 70
+            data["modules"][0]["rf_status"] = 90
+
+        changes = diff_devices([Device(**device)], [changed_device(change)])
+
+        assert changes == [
+            ChangeEvent(ChangeType.BATTERY_DROP, "device", "module", 80, 70),
+            ChangeEvent(ChangeType.RF_DROP, "device", "module", 60, 90),
+        ]
+
+    async def test_diff_devices__null_battery_and_signal__returns_other_changes(self):
+        def old_change(data):
+            data["modules"][0]["battery_percent"] = None
+            data["modules"][0]["rf_status"] = 60
+
+        def new_change(data):
+            data["modules"][0]["battery_percent"] = 50
+            data["modules"][0]["rf_status"] = None
+            data["modules"][0]["measured"]["temperature"] = 22
+
+        changes = diff_devices([changed_device(old_change)], [changed_device(new_change)])
+
+        assert changes == [ChangeEvent(ChangeType.TEMPERATURE, "device", "module", 21, 22)]
+
+    async def test_diff_devices__edited_timetable__returns_schedule_change(self):
+        def change(data):
+            data["modules"][0]["therm_program_list"][0]["timetable"].append({"id": 0, "m_offset": 60})
+
+        changes = diff_devices([Device(**device)], [changed_device(change)])
+
+        assert changes == [ChangeEvent(ChangeType.SCHEDULE, "device", "module")]
+
+    async def test_diff_devices__lazy_snapshots__returns_schedule_change_without_hydrating_programs(self):
+        changed = deepcopy(device)
+        changed["modules"][0]["therm_program_list"][0]["timetable"].append({"id": 0, "m_offset": 60})
+
+        old = Device.from_dict(deepcopy(device), lazy=True)
+        new = Device.from_dict(changed, lazy=True)
+
+        assert diff_devices([old], [Device(**device)]) == []
+        assert diff_devices([old], [new]) == [ChangeEvent(ChangeType.SCHEDULE, "device", "module")]
+        assert old.modules[0]._therm_program_list is None
+        assert new.modules[0]._therm_program_list is None
+
+    async def test_diff_devices__added_and_removed_modules__returns_module_changes(self):
+        def change(data):
+            data["modules"][0]["_id"] = "other"
+
+        changes = diff_devices([Device(**device)], [changed_device(change), Device(_id="new", system_mode="winter")])
+
+        assert changes == [
+            ChangeEvent(ChangeType.MODULE_ADDED, "device", "other"),
+            ChangeEvent(ChangeType.MODULE_REMOVED, "device", "module"),
+            ChangeEvent(ChangeType.DEVICE_ADDED, "new"),
+        ]
+
+    async def test_diff__consecutive_snapshots__returns_changes_since_previous_snapshot(self):
+        differ = SnapshotDiffer()
+
+        def change(data):
+            data["modules"][0]["measured"]["temperature"] = 22
+
+        assert differ.diff([Device(**device)]) == []
+        assert differ.diff([changed_device(change)]) == [ChangeEvent(ChangeType.TEMPERATURE, "device", "module", 21, 22)]
+        assert differ.diff([changed_device(change)]) == []
+        assert differ.diff([]) == [ChangeEvent(ChangeType.DEVICE_REMOVED, "device")]
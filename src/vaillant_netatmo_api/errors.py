@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from re import sub
 from typing import Generator
 
@@ -27,12 +29,31 @@ class NonOkResponseException(Exception):
         super().__init__(message, self.params)
 
 
+class CircuitBreakerOpenException(Exception):
+    """Exception which is thrown when circuit breaker is open after repeated failures and the request is not sent to the API."""
+
+    def __init__(self, message: str, **kwargs) -> None:
+        self.params = f"{kwargs=}"
+
+        super().__init__(message, self.params)
+
+
+class DeadlineExceededException(Exception):
+    """Exception which is thrown when the deadline of a call passes before the request could be sent to the API or before its response arrived."""
+
+    def __init__(self, message: str, **kwargs) -> None:
+        self.params = f"{kwargs=}"
+
+        super().__init__(message, self.params)
+
+
 class ApiException(Exception):
     """Base class for all exceptions related to networking."""
 
     def __init__(self, message: str, request: Request, response: Response | None) -> None:
         self.request = _sanitize_request(request)
         self.response = _sanitize_response(response)
+        self.retry_after = _get_retry_after(response)
 
         super().__init__(message, self.request, self.response)
 
@@ -73,6 +94,10 @@ class RequestException(RetryableException):
     """Exception which is thrown when server returns any other non-2xx response."""
 
 
+class ResponseDecodeException(NonRetryableException):
+    """Exception which is thrown when server returns a 2xx response, but its content can't be decoded."""
+
+
 @contextmanager
 def client_error_handler() -> Generator[None]:
     try:
@@ -116,4 +141,22 @@ def _sanitize_response(response: Response) -> dict:
         "url": response.url,
         "body": response.content,
         "duration": response.elapsed,
-    }
\ No newline at end of file
+    }
+
+def _get_retry_after(response: Response) -> float | None:
+    if not response:
+        return None
+
+    retry_after = response.headers.get("retry-after")
+    if not retry_after:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
@@ -94,4 +94,24 @@ class TestApiException:
         with pytest.raises(ApiException) as ex:
             raise ApiException("test", request=request, response=response)
         
-        assert ex.value.request["body"] == b"a=b&access_token=<FILTERED>&c=d&password=<FILTERED>&"
\ No newline at end of file
+        assert ex.value.request["body"] == b"a=b&access_token=<FILTERED>&c=d&password=<FILTERED>&"
+
+    async def test_init__retry_after_seconds_header__sets_retry_after(self):
+        request = httpx.Request("POST", "https://api.netatmo.com/")
+
+        response = httpx.Response(429, headers={"Retry-After": "12"}, request=request)
+        response.elapsed = timedelta()
+
+        e = RequestBackoffException("test", request, response)
+
+        assert e.retry_after == 12
+
+    async def test_init__no_retry_after_header__doesnt_set_retry_after(self):
+        request = httpx.Request("POST", "https://api.netatmo.com/")
+
+        response = httpx.Response(429, request=request)
+        response.elapsed = timedelta()
+
+        e = RequestBackoffException("test", request, response)
+
+        assert e.retry_after is None
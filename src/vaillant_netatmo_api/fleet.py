@@ -0,0 +1,156 @@
+"""Module containing a FleetClient for accessing the Netatmo API on behalf of many accounts."""
+
+from __future__ import annotations
+
+import asyncio
+
+from collections import deque
+from typing import AsyncGenerator
+
+from httpx import AsyncClient, Timeout
+
+from .base import JsonDecoder
+from .cache import ResponseCache
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .thermostat import Device, ThermostatClient
+from .token import TokenStore
+
+_DEFAULT_MAX_CONCURRENCY = 10
+
+
+class FleetResult:
+    """FleetResult model representing the outcome of a fleet request for one account."""
+
+    def __init__(
+        self,
+        account_id: str,
+        devices: list[Device] | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Create new fleet result model."""
+
+        self.account_id = account_id
+        self.devices = devices
+        self.error = error
+
+    @property
+    def is_ok(self) -> bool:
+        return self.error is None
+
+
+class FleetClient:
+    """
+    Client for making HTTP requests to the Netatmo API on behalf of many accounts, each with its own token store.
+
+    All the accounts share one httpx AsyncClient and one limit of concurrent requests. Each account has at most one request in flight,
+    and accounts are served in the order in which they were added, so no account can starve the others.
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        retry_policy: RetryPolicy | None = None,
+        timeouts: dict[str, Timeout] | None = None,
+        json_decoder: JsonDecoder | None = None,
+        typed_decoding: bool = False,
+    ) -> None:
+        """
+        Create new fleet client instance.
+
+        Retry policy, timeouts, JSON decoder and typed decoding are shared by all the accounts.
+        """
+
+        self._client = client
+        self._max_concurrency = max_concurrency
+        self._retry_policy = retry_policy
+        self._timeouts = timeouts
+        self._json_decoder = json_decoder
+        self._typed_decoding = typed_decoding
+        self._clients: dict[str, ThermostatClient] = {}
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @property
+    def account_ids(self) -> list[str]:
+        return list(self._clients)
+
+    def add_account(
+        self,
+        account_id: str,
+        token_store: TokenStore,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+    ) -> ThermostatClient:
+        """
+        Add an account to the fleet, replacing the existing account with the same id.
+
+        Returns the thermostat client of the account, which can be used for making requests for just this account.
+        """
+
+        client = ThermostatClient(
+            self._client,
+            token_store,
+            single_flight=True,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            retry_policy=self._retry_policy,
+            timeouts=self._timeouts,
+            json_decoder=self._json_decoder,
+            typed_decoding=self._typed_decoding,
+        )
+        self._clients[account_id] = client
+
+        return client
+
+    def remove_account(self, account_id: str) -> None:
+        """Remove an account from the fleet."""
+
+        self._clients.pop(account_id, None)
+
+    def get_client(self, account_id: str) -> ThermostatClient:
+        """Returns the thermostat client of the account."""
+
+        return self._clients[account_id]
+
+    async def async_iter_thermostats_data(self, deadline: float | None = None) -> AsyncGenerator[FleetResult, None]:
+        """
+        Get thermostat data of all the accounts from the Netatmo API.
+
+        Yields a result for each account as soon as its request completes. Errors are reported in the account's result and don't stop the sweep.
+        """
+
+        pending = deque(self._clients.items())
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def worker() -> None:
+            while pending:
+                account_id, client = pending.popleft()
+                try:
+                    devices = await client.async_get_thermostats_data(deadline=deadline)
+                except Exception as e:
+                    await results.put(FleetResult(account_id, error=e))
+                else:
+                    await results.put(FleetResult(account_id, devices=devices))
+
+        count = len(pending)
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(self._max_concurrency, count))]
+
+        try:
+            for _ in range(count):
+                yield await results.get()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def async_get_thermostats_data(self, deadline: float | None = None) -> dict[str, FleetResult]:
+        """
+        Get thermostat data of all the accounts from the Netatmo API.
+
+        Returns results of all the accounts, keyed by account id, once all the requests complete.
+        """
+
+        return {result.account_id: result async for result in self.async_iter_thermostats_data(deadline)}
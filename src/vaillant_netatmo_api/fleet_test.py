@@ -0,0 +1,89 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pytest_mock import MockerFixture
+from respx import MockRouter
+
+from vaillant_netatmo_api.errors import RequestClientException
+from vaillant_netatmo_api.fleet import FleetClient
+from vaillant_netatmo_api.thermostat import ThermostatClient
+from vaillant_netatmo_api.token import Token, TokenStore
+
+get_thermostats_data_response = {
+    "status": "ok",
+    "body": {
+        "devices": [
+            {"_id": "id", "type": "type", "station_name": "station_name", "firmware": "firmware", "system_mode": "summer", "modules": []},
+        ],
+    },
+}
+
+
+def token_store(access_token: str) -> TokenStore:
+    return TokenStore("", "", Token({"access_token": access_token, "refresh_token": "abcde", "expires_at": ""}))
+
+
+def get_thermostats_data_request(access_token: str) -> dict:
+    return {
+        "device_type": "NAVaillant",
+        "data_amount": "app",
+        "sync_device_id": "all",
+        "access_token": access_token,
+    }
+
+
+@pytest.mark.asyncio
+class TestFleet:
+    async def test_async_get_thermostats_data__partial_failure__returns_result_per_account(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request("1")).respond(200, json=get_thermostats_data_response)
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request("2")).respond(400)
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request("3")).respond(200, json=get_thermostats_data_response)
+
+        async with httpx.AsyncClient() as c:
+            fleet = FleetClient(c)
+            fleet.add_account("a", token_store("1"))
+            fleet.add_account("b", token_store("2"))
+            fleet.add_account("c", token_store("3"))
+
+            results = await fleet.async_get_thermostats_data()
+
+            assert sorted(results) == ["a", "b", "c"]
+            assert results["a"].is_ok and results["a"].devices[0].id == "id"
+            assert not results["b"].is_ok and isinstance(results["b"].error, RequestClientException)
+            assert results["c"].is_ok and results["c"].devices[0].id == "id"
+
+    async def test_async_iter_thermostats_data__many_accounts__limits_concurrent_requests(self, mocker: MockerFixture):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_thermostats_data(self, deadline=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        mocker.patch.object(ThermostatClient, "async_get_thermostats_data", get_thermostats_data)
+
+        async with httpx.AsyncClient() as c:
+            fleet = FleetClient(c, max_concurrency=3)
+            for i in range(10):
+                fleet.add_account(str(i), token_store(str(i)))
+
+            results = [result async for result in fleet.async_iter_thermostats_data()]
+
+            assert len(results) == 10
+            assert max_in_flight == 3
+
+    async def test_remove_account__existing_account__removes_account_from_sweeps(self):
+        async with httpx.AsyncClient() as c:
+            fleet = FleetClient(c)
+            fleet.add_account("a", token_store("1"))
+            fleet.add_account("b", token_store("2"))
+
+            fleet.remove_account("a")
+
+            assert fleet.account_ids == ["b"]
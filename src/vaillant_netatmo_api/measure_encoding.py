@@ -0,0 +1,141 @@
+"""Module containing a compact binary encoding of measurement series."""
+
+from __future__ import annotations
+
+import mmap
+
+from array import array
+
+from .thermostat import MeasurementItem
+
+_MAGIC = b"VNM1"
+
+
+def encode_measurement_items(measurements: list[MeasurementItem]) -> bytes:
+    """
+    Encode measurements into a compact binary format.
+
+    Begin times of the measurements are stored as delta-of-delta varints, and values as the XOR of their bits with the bits of the previous value,
+    with leading and trailing zero bytes stripped. Regular series with repeated values take one byte per value. Encoding is lossless.
+    """
+
+    out = bytearray(_MAGIC)
+    _write_varint(out, len(measurements))
+
+    previous_time = 0
+    previous_delta = 0
+    previous_bits = 0
+
+    for measurement in measurements:
+        delta = measurement.beg_time - previous_time
+        _write_varint(out, _zigzag(delta - previous_delta))
+        previous_time = measurement.beg_time
+        previous_delta = delta
+
+        _write_varint(out, measurement.step_time or 0)
+        _write_varint(out, len(measurement.value))
+
+        for bits in memoryview(array("d", measurement.value)).cast("B").cast("Q"):
+            xor = bits ^ previous_bits
+            previous_bits = bits
+
+            if xor == 0:
+                out.append(0)
+                continue
+
+            xor_bytes = xor.to_bytes(8, "big")
+            leading = min(len(xor_bytes) - len(xor_bytes.lstrip(b"\x00")), 7)
+            trailing = min(len(xor_bytes) - len(xor_bytes.rstrip(b"\x00")), 7)
+
+            out.append(0x80 | leading << 3 | trailing)
+            out += xor_bytes[leading:8 - trailing]
+
+    return bytes(out)
+
+
+def decode_measurement_items(data: bytes | bytearray | memoryview | mmap.mmap) -> list[MeasurementItem]:
+    """Decode measurements from the binary format produced by encode_measurement_items. Accepts any bytes-like object, including memory-mapped files."""
+
+    with memoryview(data) as view:
+        if bytes(view[:len(_MAGIC)]) != _MAGIC:
+            raise ValueError("Data is not an encoded measurement series.")
+
+        position = len(_MAGIC)
+        count, position = _read_varint(view, position)
+
+        measurements = []
+        previous_time = 0
+        previous_delta = 0
+        previous_bits = 0
+
+        for _ in range(count):
+            delta_of_delta, position = _read_varint(view, position)
+            previous_delta += _unzigzag(delta_of_delta)
+            previous_time += previous_delta
+
+            step_time, position = _read_varint(view, position)
+            length, position = _read_varint(view, position)
+
+            bits = array("Q", bytes(8 * length))
+            for i in range(length):
+                header = view[position]
+                position += 1
+
+                if header != 0:
+                    leading = header >> 3 & 0x07
+                    trailing = header & 0x07
+                    size = 8 - leading - trailing
+                    xor = int.from_bytes(view[position:position + size], "big") << (8 * trailing)
+                    position += size
+                    previous_bits ^= xor
+
+                bits[i] = previous_bits
+
+            values = array("d")
+            values.frombytes(bits.tobytes())
+
+            measurements.append(MeasurementItem.from_values(previous_time, step_time or None, values))
+
+        return measurements
+
+
+def write_measurement_items(path: str, measurements: list[MeasurementItem]) -> None:
+    """Encode measurements and write them into the file at the provided path."""
+
+    with open(path, "wb") as f:
+        f.write(encode_measurement_items(measurements))
+
+
+def read_measurement_items(path: str) -> list[MeasurementItem]:
+    """Read measurements from the file at the provided path, by memory-mapping the file instead of reading it into memory."""
+
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return decode_measurement_items(m)
+
+
+def _zigzag(n: int) -> int:
+    return n << 1 if n >= 0 else (-n << 1) - 1
+
+
+def _unzigzag(n: int) -> int:
+    return n >> 1 if n & 1 == 0 else -((n + 1) >> 1)
+
+
+def _write_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(view: memoryview, position: int) -> tuple[int, int]:
+    n = 0
+    shift = 0
+    while True:
+        b = view[position]
+        position += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, position
+        shift += 7
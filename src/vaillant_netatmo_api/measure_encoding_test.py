@@ -0,0 +1,40 @@
+import pytest
+
+from math import isnan
+
+from vaillant_netatmo_api.measure_encoding import decode_measurement_items, encode_measurement_items, read_measurement_items, write_measurement_items
+from vaillant_netatmo_api.thermostat import MeasurementItem
+
+
+@pytest.mark.asyncio
+class TestMeasurementEncoding:
+    async def test_decode_measurement_items__encoded_measurements__returns_same_measurements(self):
+        measurements = [
+            MeasurementItem(1642252768, 300, [[20.1], [20.1], [20.2], [-3.5], [None], [1e300]]),
+            MeasurementItem(1642262768, 300, [[21], [21.5]]),
+            MeasurementItem(1642252000, None, [[5]]),
+        ]
+
+        decoded = decode_measurement_items(encode_measurement_items(measurements))
+
+        assert decoded == measurements
+        assert isnan(decoded[0].value[4])
+
+    async def test_encode_measurement_items__regular_series__takes_less_space_than_raw_values(self):
+        measurements = [MeasurementItem(1642252768, 300, [[20 + (i // 12) / 10] for i in range(1000)])]
+
+        encoded = encode_measurement_items(measurements)
+
+        assert len(encoded) < 1000 * 8 / 4
+
+    async def test_decode_measurement_items__invalid_data__raises_error(self):
+        with pytest.raises(ValueError):
+            decode_measurement_items(b"invalid")
+
+    async def test_read_measurement_items__written_file__returns_same_measurements(self, tmp_path):
+        measurements = [MeasurementItem(1642252768, 600, [[20], [20.5]])]
+        path = str(tmp_path / "series.bin")
+
+        write_measurement_items(path, measurements)
+
+        assert read_measurement_items(path) == measurements
@@ -0,0 +1,113 @@
+"""Module containing an in-memory index of measurement data of the Netatmo API."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import datetime
+from math import isnan
+
+from .thermostat import MeasurementItem, merge_measurement_items
+
+
+class MeasurementIndex:
+    """
+    In-memory index of measurements of one series, for fast point and range queries.
+
+    Measurements are kept as sorted runs which don't overlap. Queries find the run by binary search over the begin times of the runs,
+    and the value inside the run from its begin time and step, so they don't scan the values.
+    """
+
+    def __init__(self, measurements: list[MeasurementItem] | None = None) -> None:
+        """Create new index instance, containing the provided measurements."""
+
+        self._runs: list[MeasurementItem] = []
+        self._begins: list[int] = []
+
+        if measurements:
+            self.add(measurements)
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self._runs)
+
+    @property
+    def runs(self) -> list[MeasurementItem]:
+        """Returns the sorted runs of the index."""
+
+        return list(self._runs)
+
+    def add(self, measurements: list[MeasurementItem]) -> None:
+        """
+        Add measurements to the index.
+
+        Adjacent runs with the same step are joined. Where runs overlap, the values of the run which begins earlier are kept, no matter if it was already
+        in the index or not. For runs which begin at the same time, the values already in the index are kept.
+
+        Each call merges all the indexed runs again, so it takes time proportional to the size of the whole index. Add measurements in batches rather
+        than one by one.
+        """
+
+        measurements = [m for m in measurements if m.beg_time is not None and len(m)]
+        if not measurements:
+            return
+
+        self._runs = merge_measurement_items(self._runs + measurements)
+        self._begins = [run.beg_time for run in self._runs]
+
+    def value_at(self, time: datetime) -> float | None:
+        """Returns the value of the measurement interval containing the provided time, or None if there is no value for it."""
+
+        t = time.timestamp()
+        i = bisect_right(self._begins, t) - 1
+        if i < 0:
+            return None
+
+        run = self._runs[i]
+        index = int((t - run.beg_time) // (run.step_time or 1))
+        if index >= len(run):
+            return None
+
+        return _to_value(run.value[index])
+
+    def values_between(self, start: datetime, end: datetime) -> list[MeasurementItem]:
+        """Returns measurements with copies of the values in the [start, end) range."""
+
+        end_timestamp = end.timestamp()
+        i = max(0, bisect_right(self._begins, start.timestamp()) - 1)
+
+        measurements = []
+        while i < len(self._runs) and self._begins[i] < end_timestamp:
+            measurement = self._runs[i].between(start, end)
+            if len(measurement):
+                measurements.append(measurement)
+            i += 1
+
+        return measurements
+
+    def nearest(self, time: datetime) -> tuple[int, float | None] | None:
+        """Returns a timestamp and value of the measurement nearest to the provided time, or None if the index is empty."""
+
+        if not self._runs:
+            return None
+
+        t = time.timestamp()
+        i = bisect_right(self._begins, t) - 1
+
+        candidates = []
+        if i >= 0:
+            run = self._runs[i]
+            timestamps = run.timestamps
+            index = min(int((t - run.beg_time) // (timestamps.step)), len(timestamps) - 1)
+            candidates.append((timestamps[index], run.value[index]))
+            if index + 1 < len(timestamps):
+                candidates.append((timestamps[index + 1], run.value[index + 1]))
+        if i + 1 < len(self._runs):
+            run = self._runs[i + 1]
+            candidates.append((run.beg_time, run.value[0]))
+
+        timestamp, value = min(candidates, key=lambda c: abs(c[0] - t))
+
+        return timestamp, _to_value(value)
+
+
+def _to_value(value: float) -> float | None:
+    return None if isnan(value) else value
@@ -0,0 +1,63 @@
+import pytest
+
+from datetime import datetime
+
+from vaillant_netatmo_api.measure_index import MeasurementIndex
+from vaillant_netatmo_api.thermostat import MeasurementItem
+
+
+def at(timestamp: int) -> datetime:
+    return datetime.fromtimestamp(timestamp)
+
+
+@pytest.mark.asyncio
+class TestMeasurementIndex:
+    async def test_add__overlapping_and_adjacent_runs__merges_runs(self):
+        index = MeasurementIndex([MeasurementItem(1600, 300, [[22], [23]])])
+
+        index.add([MeasurementItem(1000, 300, [[20], [21]]), MeasurementItem(1900, 300, [[30], [24]]), MeasurementItem(5000, 300, [[25]])])
+
+        assert index.runs == [MeasurementItem(1000, 300, [[20], [21], [22], [23], [24]]), MeasurementItem(5000, 300, [[25]])]
+        assert len(index) == 6
+
+    async def test_add__run_beginning_before_indexed_run__keeps_values_of_earlier_run(self):
+        index = MeasurementIndex([MeasurementItem(1300, 300, [[30], [31]])])
+
+        index.add([MeasurementItem(1000, 300, [[20], [21]])])
+
+        assert index.runs == [MeasurementItem(1000, 300, [[20], [21], [31]])]
+
+    async def test_value_at__time_inside_interval__returns_value(self):
+        index = MeasurementIndex([MeasurementItem(1000, 300, [[20], [None], [22]]), MeasurementItem(5000, 300, [[25]])])
+
+        assert index.value_at(at(999)) is None
+        assert index.value_at(at(1000)) == 20
+        assert index.value_at(at(1299)) == 20
+        assert index.value_at(at(1300)) is None
+        assert index.value_at(at(1700)) == 22
+        assert index.value_at(at(1900)) is None
+        assert index.value_at(at(5100)) == 25
+
+    async def test_values_between__range_across_runs__returns_values_in_range(self):
+        index = MeasurementIndex([MeasurementItem(1000, 300, [[20], [21], [22]]), MeasurementItem(5000, 300, [[25], [26]])])
+
+        measurements = index.values_between(at(1200), at(5300))
+
+        assert measurements == [MeasurementItem(1300, 300, [[21], [22]]), MeasurementItem(5000, 300, [[25]])]
+
+    async def test_values_between__range_in_gap__returns_no_values(self):
+        index = MeasurementIndex([MeasurementItem(1000, 300, [[20]]), MeasurementItem(5000, 300, [[25]])])
+
+        assert index.values_between(at(2000), at(4000)) == []
+
+    async def test_nearest__time_between_values__returns_nearest_value(self):
+        index = MeasurementIndex([MeasurementItem(1000, 300, [[20], [21]]), MeasurementItem(5000, 300, [[25]])])
+
+        assert index.nearest(at(0)) == (1000, 20)
+        assert index.nearest(at(1200)) == (1300, 21)
+        assert index.nearest(at(3000)) == (1300, 21)
+        assert index.nearest(at(4000)) == (5000, 25)
+        assert index.nearest(at(9000)) == (5000, 25)
+
+    async def test_nearest__empty_index__returns_none(self):
+        assert MeasurementIndex().nearest(at(1000)) is None
@@ -0,0 +1,111 @@
+"""Module containing planning of measurement requests to the Netatmo API."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from .errors import UnsuportedArgumentsException
+from .thermostat import (
+    MEASUREMENT_SCALE_SECONDS,
+    MeasurementItem,
+    MeasurementScale,
+    MeasurementType,
+    ThermostatClient,
+    get_measure_windows,
+)
+
+# The max scale is left out, since the API doesn't document its step.
+_PLANNED_SCALES = [
+    MeasurementScale.FIVE_MINS,
+    MeasurementScale.HALF_HOUR,
+    MeasurementScale.HOUR,
+    MeasurementScale.THREE_HOURS,
+    MeasurementScale.SIX_HOURS,
+    MeasurementScale.DAY,
+    MeasurementScale.WEEK,
+    MeasurementScale.MONTH,
+]
+
+
+class MeasurePlan:
+    """MeasurePlan model representing the requests needed for fetching measurements of a time range in the chosen scale."""
+
+    def __init__(
+        self,
+        scale: MeasurementScale,
+        date_begin: datetime,
+        date_end: datetime,
+        windows: list[tuple[int, int]],
+    ) -> None:
+        """Create new measure plan model."""
+
+        self.scale = scale
+        self.date_begin = date_begin
+        self.date_end = date_end
+        self.windows = windows
+
+    @property
+    def request_count(self) -> int:
+        return len(self.windows)
+
+    @property
+    def point_count(self) -> int:
+        """Returns the number of values the plan fetches if there are no missing values."""
+
+        return _get_point_count(self.scale, self.date_begin, self.date_end)
+
+    async def async_execute(
+        self,
+        client: ThermostatClient,
+        device_id: str,
+        module_id: str,
+        type: MeasurementType,
+        deadline: float | None = None,
+    ) -> list[MeasurementItem]:
+        """Fetch the measurements of the plan from the Netatmo API, with one request per window of the plan."""
+
+        return await client.async_get_measure(device_id, module_id, type, self.scale, self.date_begin, self.date_end, deadline=deadline)
+
+
+def plan_measure(
+    date_begin: datetime,
+    date_end: datetime,
+    max_points: int | None = None,
+    resolution: timedelta | None = None,
+    max_requests: int | None = None,
+) -> MeasurePlan:
+    """
+    Choose the measurement scale for fetching the time range, and plan the requests for it.
+
+    Only scales which fit into max points values and max requests requests are considered. If resolution is provided, the coarsest of them
+    with a step no longer than the resolution is chosen, since finer scales only cost more requests. Otherwise, or if none of them is fine enough,
+    the finest of them is chosen. If no scale fits the limits, throws an exception.
+    """
+
+    begin = round(date_begin.timestamp())
+    end = round(date_end.timestamp())
+
+    plans = [
+        MeasurePlan(scale, date_begin, date_end, get_measure_windows(scale, begin, end))
+        for scale in _PLANNED_SCALES
+    ]
+    plans = [
+        plan for plan in plans
+        if (max_points is None or plan.point_count <= max_points) and (max_requests is None or plan.request_count <= max_requests)
+    ]
+
+    if not plans:
+        raise UnsuportedArgumentsException("No measurement scale fits the provided limits.", max_points=max_points, max_requests=max_requests)
+
+    if resolution is not None:
+        fine_enough = [plan for plan in plans if MEASUREMENT_SCALE_SECONDS[plan.scale] <= resolution.total_seconds()]
+        if fine_enough:
+            return fine_enough[-1]
+
+    return plans[0]
+
+
+def _get_point_count(scale: MeasurementScale, date_begin: datetime, date_end: datetime) -> int:
+    step = MEASUREMENT_SCALE_SECONDS[scale]
+
+    return max(0, round(date_end.timestamp()) - round(date_begin.timestamp())) // step + 1
@@ -0,0 +1,76 @@
+import pytest
+
+from datetime import datetime, timedelta
+
+from respx import MockRouter
+
+from vaillant_netatmo_api.errors import UnsuportedArgumentsException
+from vaillant_netatmo_api.measure_plan import plan_measure
+from vaillant_netatmo_api.thermostat import MeasurementItem, MeasurementScale, MeasurementType, thermostat_client
+from vaillant_netatmo_api.token import Token
+
+token = Token({
+    "access_token": "12345",
+    "refresh_token": "abcde",
+    "expires_at": "",
+})
+
+date_begin = datetime.fromtimestamp(0)
+date_end = datetime.fromtimestamp(30 * 24 * 60 * 60)
+
+
+@pytest.mark.asyncio
+class TestMeasurePlan:
+    async def test_plan_measure__no_limits__returns_finest_scale(self):
+        plan = plan_measure(date_begin, date_end)
+
+        assert plan.scale == MeasurementScale.FIVE_MINS
+        assert plan.request_count == 9
+
+    async def test_plan_measure__max_points__returns_finest_scale_within_points(self):
+        plan = plan_measure(date_begin, date_end, max_points=1000)
+
+        assert plan.scale == MeasurementScale.HOUR
+        assert plan.point_count == 721
+        assert plan.request_count == 1
+
+    async def test_plan_measure__max_requests__returns_finest_scale_within_requests(self):
+        plan = plan_measure(date_begin, date_end, max_requests=2)
+
+        assert plan.scale == MeasurementScale.HALF_HOUR
+        assert plan.windows == [(0, 1843199), (1843200, 2592000)]
+
+    async def test_plan_measure__resolution__returns_coarsest_scale_within_resolution(self):
+        plan = plan_measure(date_begin, date_end, resolution=timedelta(hours=4))
+
+        assert plan.scale == MeasurementScale.THREE_HOURS
+
+    async def test_plan_measure__resolution_finer_than_limits__returns_finest_scale_within_limits(self):
+        plan = plan_measure(date_begin, date_end, resolution=timedelta(minutes=5), max_points=200)
+
+        assert plan.scale == MeasurementScale.SIX_HOURS
+
+    async def test_plan_measure__no_scale_within_limits__raises_error(self):
+        with pytest.raises(UnsuportedArgumentsException):
+            plan_measure(date_begin, date_end, max_points=1)
+
+    async def test_async_execute__planned_scale__fetches_measurements(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data={
+            "device_id": "device",
+            "module_id": "module",
+            "type": "temperature",
+            "scale": "1day",
+            "date_begin": 0,
+            "date_end": 2592000,
+            "access_token": "12345",
+        }).respond(200, json={
+            "status": "ok",
+            "body": [{"beg_time": 0, "step_time": 86400, "value": [[20], [21]]}],
+        })
+
+        plan = plan_measure(date_begin, date_end, resolution=timedelta(days=1))
+
+        async with thermostat_client("", "", token, None) as client:
+            measurements = await plan.async_execute(client, "device", "module", MeasurementType.TEMPERATURE)
+
+        assert measurements == [MeasurementItem(0, 86400, [[20], [21]])]
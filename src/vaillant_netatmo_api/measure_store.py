@@ -0,0 +1,227 @@
+"""Module containing a persistent local store for measurement data of the Netatmo API."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+from array import array
+from datetime import datetime
+from functools import partial
+from threading import Lock
+
+from .thermostat import MeasurementItem, MeasurementScale, MeasurementType, ThermostatClient
+from .time import now
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    id INTEGER PRIMARY KEY,
+    device_id TEXT NOT NULL,
+    module_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    scale TEXT NOT NULL,
+    last_time INTEGER,
+    UNIQUE (device_id, module_id, type, scale)
+);
+CREATE TABLE IF NOT EXISTS points (
+    series_id INTEGER NOT NULL REFERENCES series (id),
+    time INTEGER NOT NULL,
+    step INTEGER NOT NULL,
+    value REAL,
+    PRIMARY KEY (series_id, time)
+) WITHOUT ROWID;
+"""
+
+
+class MeasurementStore:
+    """
+    Persistent local store for measurements, backed by SQLite.
+
+    Measurements are stored per series, identified by device, module, measurement type and scale. For each series, the store records the time of the
+    last synced value, so syncing only fetches the missing tail of the series from the API instead of the whole history.
+
+    Methods other than async_sync are blocking. Async sync runs the database queries in the default executor of the event loop, so they don't block it.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """Create new store instance, using the SQLite database at the provided path. The database is created if it doesn't exist."""
+
+        # The connection is shared with the executor threads of async sync, and the lock keeps only one thread using it at a time.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> MeasurementStore:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+
+        with self._lock:
+            self._connection.close()
+
+    def get_last_time(
+        self,
+        device_id: str,
+        module_id: str,
+        type: MeasurementType,
+        scale: MeasurementScale,
+    ) -> int | None:
+        """Returns a timestamp of the last synced value of the series, or None if the series was never synced."""
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT last_time FROM series WHERE device_id = ? AND module_id = ? AND type = ? AND scale = ?",
+                (device_id, module_id, type.value, scale.value),
+            ).fetchone()
+
+        return None if row is None else row[0]
+
+    def add(
+        self,
+        device_id: str,
+        module_id: str,
+        type: MeasurementType,
+        scale: MeasurementScale,
+        measurements: list[MeasurementItem],
+    ) -> None:
+        """Store the measurements of the series. Values which are already stored for the same time are replaced."""
+
+        with self._lock, self._connection:
+            series_id = self._get_series_id(device_id, module_id, type, scale)
+
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO points (series_id, time, step, value) VALUES (?, ?, ?, ?)",
+                [
+                    (series_id, time, measurement.step_time or 0, value)
+                    for measurement in measurements
+                    for time, value in zip(measurement.timestamps, measurement.value)
+                ],
+            )
+
+            self._connection.execute(
+                "UPDATE series SET last_time = (SELECT MAX(time) FROM points WHERE series_id = ?) WHERE id = ?",
+                (series_id, series_id),
+            )
+
+    def get(
+        self,
+        device_id: str,
+        module_id: str,
+        type: MeasurementType,
+        scale: MeasurementScale,
+        date_begin: datetime,
+        date_end: datetime | None = None,
+    ) -> list[MeasurementItem]:
+        """Returns stored measurements of the series in the provided range, with both ends included."""
+
+        rows = self._get_rows(device_id, module_id, type, scale, date_begin, date_end)
+
+        measurements: list[MeasurementItem] = []
+        for time, step, value in rows:
+            value = float("nan") if value is None else value
+
+            previous = measurements[-1] if measurements else None
+            if previous is not None and step and previous.step_time == step and previous.end_time + step == time:
+                previous.value.append(value)
+            else:
+                measurements.append(MeasurementItem.from_values(time, step or None, array("d", [value])))
+
+        return measurements
+
+    def find_gaps(
+        self,
+        device_id: str,
+        module_id: str,
+        type: MeasurementType,
+        scale: MeasurementScale,
+        date_begin: datetime | None = None,
+        date_end: datetime | None = None,
+    ) -> list[tuple[int, int]]:
+        """
+        Returns ranges of the series with missing values, as tuples of timestamps of the values before and after the gap.
+
+        A gap is any distance between two stored values which is longer than the step of the earlier value.
+        """
+
+        rows = self._get_rows(device_id, module_id, type, scale, date_begin, date_end)
+
+        gaps = []
+        for (time, step, _), (next_time, _, _) in zip(rows, rows[1:]):
+            if step and next_time - time > step:
+                gaps.append((time, next_time))
+
+        return gaps
+
+    async def async_sync(
+        self,
+        client: ThermostatClient,
+        device_id: str,
+        module_id: str,
+        type: MeasurementType,
+        scale: MeasurementScale,
+        date_begin: datetime,
+        date_end: datetime | None = None,
+    ) -> list[MeasurementItem]:
+        """
+        Fetch the values of the series which are not stored yet from the Netatmo API and store them.
+
+        If the series was synced before, fetching starts from the last synced value, which is fetched again since its interval could still be open.
+        Otherwise, fetching starts from date begin. Returns the fetched measurements.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        begin = round(date_begin.timestamp())
+        last_time = await loop.run_in_executor(None, partial(self.get_last_time, device_id, module_id, type, scale))
+        if last_time is not None and last_time > begin:
+            begin = last_time
+
+        end = date_end if date_end is not None else now()
+        if begin > end.timestamp():
+            return []
+
+        measurements = []
+        async for chunk in client.async_iter_measure(device_id, module_id, type, scale, datetime.fromtimestamp(begin), end):
+            await loop.run_in_executor(None, partial(self.add, device_id, module_id, type, scale, chunk))
+            measurements.extend(chunk)
+
+        return measurements
+
+    def _get_series_id(self, device_id: str, module_id: str, type: MeasurementType, scale: MeasurementScale) -> int:
+        self._connection.execute(
+            "INSERT OR IGNORE INTO series (device_id, module_id, type, scale) VALUES (?, ?, ?, ?)",
+            (device_id, module_id, type.value, scale.value),
+        )
+
+        return self._connection.execute(
+            "SELECT id FROM series WHERE device_id = ? AND module_id = ? AND type = ? AND scale = ?",
+            (device_id, module_id, type.value, scale.value),
+        ).fetchone()[0]
+
+    def _get_rows(
+        self,
+        device_id: str,
+        module_id: str,
+        type: MeasurementType,
+        scale: MeasurementScale,
+        date_begin: datetime | None,
+        date_end: datetime | None,
+    ) -> list[tuple[int, int, float | None]]:
+        begin = 0 if date_begin is None else round(date_begin.timestamp())
+        end = None if date_end is None else round(date_end.timestamp())
+
+        with self._lock:
+            return self._connection.execute(
+                """
+                SELECT points.time, points.step, points.value
+                FROM points JOIN series ON points.series_id = series.id
+                WHERE series.device_id = ? AND series.module_id = ? AND series.type = ? AND series.scale = ?
+                    AND points.time >= ? AND (? IS NULL OR points.time <= ?)
+                ORDER BY points.time
+                """,
+                (device_id, module_id, type.value, scale.value, begin, end, end),
+            ).fetchall()
@@ -0,0 +1,96 @@
+import pytest
+import threading
+
+from datetime import datetime
+
+from respx import MockRouter
+
+from vaillant_netatmo_api.measure_store import MeasurementStore
+from vaillant_netatmo_api.thermostat import MeasurementItem, MeasurementScale, MeasurementType, thermostat_client
+from vaillant_netatmo_api.token import Token
+
+token = Token({
+    "access_token": "12345",
+    "refresh_token": "abcde",
+    "expires_at": "",
+})
+
+get_measure_request = {
+    "device_id": "device",
+    "module_id": "module",
+    "type": "temperature",
+    "scale": "5min",
+    "access_token": "12345",
+}
+
+series = ("device", "module", MeasurementType.TEMPERATURE, MeasurementScale.FIVE_MINS)
+
+
+@pytest.mark.asyncio
+class TestMeasurementStore:
+    async def test_get__stored_measurements__returns_contiguous_measurements(self):
+        with MeasurementStore() as store:
+            store.add(*series, [MeasurementItem(1000, 300, [[20], [21]]), MeasurementItem(1600, 300, [[22]])])
+
+            measurements = store.get(*series, datetime.fromtimestamp(1000))
+
+            assert measurements == [MeasurementItem(1000, 300, [[20], [21], [22]])]
+            assert store.get_last_time(*series) == 1600
+
+    async def test_get__overlapping_measurements__replaces_stored_values(self):
+        with MeasurementStore() as store:
+            store.add(*series, [MeasurementItem(1000, 300, [[20], [21]])])
+            store.add(*series, [MeasurementItem(1300, 300, [[25], [26]])])
+
+            measurements = store.get(*series, datetime.fromtimestamp(1000))
+
+            assert measurements == [MeasurementItem(1000, 300, [[20], [25], [26]])]
+
+    async def test_find_gaps__measurements_with_missing_values__returns_gaps(self):
+        with MeasurementStore() as store:
+            store.add(*series, [MeasurementItem(1000, 300, [[20], [21]]), MeasurementItem(2200, 300, [[22]])])
+
+            gaps = store.find_gaps(*series)
+
+            assert gaps == [(1300, 2200)]
+
+    async def test_async_sync__previously_synced_series__fetches_only_missing_tail(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data={**get_measure_request, "date_begin": 1000, "date_end": 1600}).respond(200, json={
+            "status": "ok",
+            "body": [{"beg_time": 1000, "step_time": 300, "value": [[20], [21], [22]]}],
+        })
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data={**get_measure_request, "date_begin": 1600, "date_end": 2200}).respond(200, json={
+            "status": "ok",
+            "body": [{"beg_time": 1600, "step_time": 300, "value": [[23], [24], [25]]}],
+        })
+
+        with MeasurementStore() as store:
+            async with thermostat_client("", "", token, None) as client:
+                await store.async_sync(client, *series, datetime.fromtimestamp(1000), datetime.fromtimestamp(1600))
+                measurements = await store.async_sync(client, *series, datetime.fromtimestamp(1000), datetime.fromtimestamp(2200))
+
+            assert respx_mock.calls.call_count == 2
+            assert measurements == [MeasurementItem(1600, 300, [[23], [24], [25]])]
+            assert store.get(*series, datetime.fromtimestamp(1000)) == [MeasurementItem(1000, 300, [[20], [21], [23], [24], [25]])]
+
+    async def test_async_sync__new_series__stores_measurements_outside_event_loop_thread(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data={**get_measure_request, "date_begin": 1000, "date_end": 1600}).respond(200, json={
+            "status": "ok",
+            "body": [{"beg_time": 1000, "step_time": 300, "value": [[20], [21], [22]]}],
+        })
+
+        with MeasurementStore() as store:
+            add = store.add
+            threads = []
+
+            def add_in_thread(*args):
+                threads.append(threading.get_ident())
+                add(*args)
+
+            store.add = add_in_thread
+
+            async with thermostat_client("", "", token, None) as client:
+                await store.async_sync(client, *series, datetime.fromtimestamp(1000), datetime.fromtimestamp(1600))
+
+            assert threads and threading.get_ident() not in threads
+            assert store.get(*series, datetime.fromtimestamp(1000)) == [MeasurementItem(1000, 300, [[20], [21], [22]])]
@@ -0,0 +1,80 @@
+"""Module containing a shared connection pool for the Netatmo API clients."""
+
+from __future__ import annotations
+
+import asyncio
+
+from httpx import AsyncClient, HTTPError, Limits
+
+from .base import API_HOST
+
+_DEFAULT_MAX_CONNECTIONS = 100
+_DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+_DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+
+class ClientPool:
+    """
+    Long-lived connection pool which can be shared by all the clients of an application.
+
+    Wraps a single httpx AsyncClient with configurable connection limits and optional HTTP/2 multiplexing. Its client should be provided to
+    AuthClient and ThermostatClient instances, or to auth_client and thermostat_client context managers, so they reuse the same connections.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = _DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = _DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+        http2: bool = False,
+    ) -> None:
+        """
+        Create new client pool instance.
+
+        HTTP/2 requires the optional http2 dependencies, installed with the http2 extra of this library.
+        """
+
+        self._limits = Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2
+        self._client = None
+
+    async def __aenter__(self) -> ClientPool:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    @property
+    def client(self) -> AsyncClient:
+        """Returns the shared httpx AsyncClient, creating it on first access."""
+
+        if self._client is None:
+            self._client = AsyncClient(limits=self._limits, http2=self._http2)
+
+        return self._client
+
+    async def async_warm_up(self, connections: int = 1) -> None:
+        """
+        Open connections to the Netatmo API ahead of the first request, so the first requests don't pay for the connection and TLS handshake.
+
+        Warm up is best effort, errors are ignored and will surface on the actual requests.
+        """
+
+        await asyncio.gather(*[self._async_open_connection() for _ in range(connections)])
+
+    async def aclose(self) -> None:
+        """Close all the connections of the pool."""
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _async_open_connection(self) -> None:
+        try:
+            await self.client.head(API_HOST)
+        except HTTPError:
+            pass
@@ -0,0 +1,46 @@
+import httpx
+import pytest
+
+from respx import MockRouter
+
+from vaillant_netatmo_api.pool import ClientPool
+from vaillant_netatmo_api.thermostat import thermostat_client
+from vaillant_netatmo_api.token import Token
+
+token = Token({
+    "access_token": "12345",
+    "refresh_token": "abcde",
+    "expires_at": "",
+})
+
+
+@pytest.mark.asyncio
+class TestClientPool:
+    async def test_client__multiple_accesses__returns_same_client(self):
+        async with ClientPool() as pool:
+            assert pool.client is pool.client
+
+    async def test_async_warm_up__multiple_connections__sends_head_requests(self, respx_mock: MockRouter):
+        route = respx_mock.head("https://api.netatmo.com/").respond(404)
+
+        async with ClientPool() as pool:
+            await pool.async_warm_up(connections=3)
+
+        assert route.call_count == 3
+
+    async def test_async_warm_up__network_error__doesnt_raise_error(self, respx_mock: MockRouter):
+        respx_mock.head("https://api.netatmo.com/").mock(side_effect=httpx.ConnectError("error"))
+
+        async with ClientPool() as pool:
+            await pool.async_warm_up()
+
+    async def test_aclose__shared_client_used_by_context_manager__stays_open_until_pool_closes(self):
+        async with ClientPool() as pool:
+            async with thermostat_client("", "", token, None, client=pool.client):
+                pass
+
+            assert not pool.client.is_closed
+
+            client = pool.client
+
+        assert client.is_closed
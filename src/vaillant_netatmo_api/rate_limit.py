@@ -0,0 +1,102 @@
+"""Module containing a client side rate limiter for the Netatmo API."""
+
+from __future__ import annotations
+
+import asyncio
+
+from time import monotonic
+
+
+class RateLimit:
+    """
+    Token bucket representing a budget of requests which can be made in a given period.
+
+    The budget is refilled continuously, so after an idle period the whole budget is available again.
+    """
+
+    def __init__(self, requests: int, period: float) -> None:
+        """Create new rate limit allowing the provided number of requests per period of seconds."""
+
+        self.requests = requests
+        self.period = period
+
+        self._tokens = float(requests)
+        self._updated_at = monotonic()
+
+    @property
+    def remaining(self) -> int:
+        """Returns a number of requests which can be made right now without waiting."""
+
+        self._refill(monotonic())
+
+        return int(self._tokens)
+
+    def _refill(self, n: float) -> None:
+        self._tokens = min(self.requests, self._tokens + (n - self._updated_at) * self.requests / self.period)
+        self._updated_at = n
+
+    def _wait_time(self, n: float) -> float:
+        self._refill(n)
+
+        if self._tokens >= 1:
+            return 0.0
+
+        return (1 - self._tokens) * self.period / self.requests
+
+    def _consume(self) -> None:
+        self._tokens -= 1
+
+    def _drain(self) -> None:
+        self._refill(monotonic())
+        self._tokens = min(self._tokens, 0.0)
+
+
+class RateLimiter:
+    """
+    Client side rate limiter enforcing multiple rate limits at once (ie. short and long window quotas of a user).
+
+    Requests which exceed the budget are not failed, but are queued and resumed in the order in which they arrived.
+    One rate limiter should be shared by all the clients accessing the API on behalf of the same user.
+    """
+
+    def __init__(self, limits: list[RateLimit] | None = None) -> None:
+        """
+        Create new rate limiter instance.
+
+        If no limits are provided, Netatmo's default per user limits are used: 50 requests per 10 seconds and 500 requests per hour.
+        """
+
+        if limits is None:
+            limits = [RateLimit(50, 10), RateLimit(500, 3600)]
+
+        self.limits = limits
+        self._lock = None
+
+    @property
+    def remaining(self) -> int:
+        """Returns a number of requests which can be made right now without waiting, across all the limits."""
+
+        return min([limit.remaining for limit in self.limits], default=0)
+
+    async def acquire(self) -> None:
+        """Waits until all the limits allow one more request and consumes it from each of them."""
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                n = monotonic()
+                wait_time = max([limit._wait_time(n) for limit in self.limits], default=0.0)
+                if wait_time <= 0:
+                    break
+                await asyncio.sleep(wait_time)
+
+            for limit in self.limits:
+                limit._consume()
+
+    def drain(self) -> None:
+        """Empties all the limits, ie. after the API responded that the quota is exceeded, so the next requests wait for a refill."""
+
+        for limit in self.limits:
+            limit._drain()
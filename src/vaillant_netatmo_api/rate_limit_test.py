@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from pytest_mock import MockerFixture
+
+from vaillant_netatmo_api.rate_limit import RateLimit, RateLimiter
+
+
+class FakeClock:
+    def __init__(self, mocker: MockerFixture) -> None:
+        self.now = 1000.0
+        self.sleeps = []
+
+        mocker.patch("vaillant_netatmo_api.rate_limit.monotonic", side_effect=lambda: self.now)
+        mocker.patch("vaillant_netatmo_api.rate_limit.asyncio.sleep", side_effect=self.sleep)
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.mark.asyncio
+class TestRateLimiter:
+    async def test_acquire__budget_available__doesnt_wait(self, mocker: MockerFixture):
+        clock = FakeClock(mocker)
+        limiter = RateLimiter([RateLimit(5, 10)])
+
+        for _ in range(5):
+            await limiter.acquire()
+
+        assert clock.sleeps == []
+        assert limiter.remaining == 0
+
+    async def test_acquire__budget_exhausted__waits_for_refill(self, mocker: MockerFixture):
+        clock = FakeClock(mocker)
+        limiter = RateLimiter([RateLimit(5, 10)])
+
+        for _ in range(6):
+            await limiter.acquire()
+
+        assert clock.sleeps == [pytest.approx(2.0)]
+
+    async def test_acquire__multiple_limits__waits_for_the_most_restrictive_limit(self, mocker: MockerFixture):
+        clock = FakeClock(mocker)
+        limiter = RateLimiter([RateLimit(5, 10), RateLimit(2, 100)])
+
+        for _ in range(3):
+            await limiter.acquire()
+
+        assert clock.sleeps == [pytest.approx(50.0)]
+
+    async def test_acquire__concurrent_requests__resumes_requests_in_arrival_order(self, mocker: MockerFixture):
+        FakeClock(mocker)
+        limiter = RateLimiter([RateLimit(1, 1)])
+        order = []
+
+        async def request(i):
+            await limiter.acquire()
+            order.append(i)
+
+        await asyncio.gather(*[request(i) for i in range(5)])
+
+        assert order == [0, 1, 2, 3, 4]
+
+    async def test_drain__full_budget__empties_all_limits(self, mocker: MockerFixture):
+        FakeClock(mocker)
+        limiter = RateLimiter()
+
+        limiter.drain()
+
+        assert limiter.remaining == 0
@@ -0,0 +1,129 @@
+"""Module containing local resampling of measurement data of the Netatmo API."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from enum import Enum
+from math import fsum, isnan
+
+from .errors import UnsuportedArgumentsException
+from .thermostat import MEASUREMENT_SCALE_SECONDS, MISSING_VALUE, MeasurementItem, MeasurementScale, MeasurementType, merge_measurement_items
+
+_SUM_MEASUREMENT_TYPES = {
+    MeasurementType.SUM_BOILER_ON,
+    MeasurementType.SUM_BOILER_OFF,
+    MeasurementType.SUM_ENERGY_GAS_HEATING,
+    MeasurementType.SUM_ENERGY_GAS_WATER,
+    MeasurementType.SUM_ENERGY_ELEC_HEATING,
+    MeasurementType.SUM_ENERGY_ELEC_WATER,
+}
+
+
+class Aggregation(Enum):
+    """Aggregation enumeration representing possible ways of combining values when resampling measurements."""
+
+    MEAN = "mean"
+    MIN = "min"
+    MAX = "max"
+    SUM = "sum"
+
+
+def resample(
+    measurements: list[MeasurementItem],
+    scale: MeasurementScale,
+    type: MeasurementType = MeasurementType.TEMPERATURE,
+    aggregation: Aggregation | None = None,
+) -> list[MeasurementItem]:
+    """
+    Resample measurements of a finer scale into the provided coarser scale, instead of fetching the coarser scale from the API again.
+
+    Values are grouped into intervals aligned to the local calendar, the same way the API aligns them: hours within a day, days at midnight,
+    weeks on Monday and months on the first day of the month. If aggregation is not provided, values of cumulative measurement types (ie. boiler
+    on time or energy) are summed and values of other types are averaged. Missing values are ignored, intervals with only missing values are
+    missing in the result and intervals without values are left out.
+    """
+
+    if scale == MeasurementScale.MAX:
+        raise UnsuportedArgumentsException("Measurements can't be resampled into the max scale.", scale=scale)
+
+    if aggregation is None:
+        aggregation = Aggregation.SUM if type in _SUM_MEASUREMENT_TYPES else Aggregation.MEAN
+
+    resampled: list[MeasurementItem] = []
+    bucket: tuple[int, int] | None = None
+    values: list[float] = []
+
+    for measurement in merge_measurement_items(measurements):
+        timestamps = measurement.timestamps
+        start_index = 0
+
+        while start_index < len(timestamps):
+            begin, end = _get_bucket(timestamps[start_index], scale)
+            end_index = bisect_left(timestamps, end, start_index)
+
+            if bucket != (begin, end):
+                if bucket is not None:
+                    _append(resampled, bucket, _aggregate(values, aggregation))
+                bucket = (begin, end)
+                values = []
+
+            values.extend([v for v in measurement.value[start_index:end_index] if not isnan(v)])
+            start_index = end_index
+
+    if bucket is not None:
+        _append(resampled, bucket, _aggregate(values, aggregation))
+
+    return resampled
+
+
+def _get_bucket(timestamp: int, scale: MeasurementScale) -> tuple[int, int]:
+    dt = datetime.fromtimestamp(timestamp)
+    midnight = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    if scale == MeasurementScale.DAY:
+        return _to_bucket(midnight, midnight + timedelta(days=1))
+
+    if scale == MeasurementScale.WEEK:
+        monday = midnight - timedelta(days=midnight.weekday())
+        return _to_bucket(monday, monday + timedelta(days=7))
+
+    if scale == MeasurementScale.MONTH:
+        first = midnight.replace(day=1)
+        return _to_bucket(first, (first + timedelta(days=32)).replace(day=1))
+
+    step = MEASUREMENT_SCALE_SECONDS[scale]
+    day_begin = round(midnight.timestamp())
+    begin = day_begin + (timestamp - day_begin) // step * step
+
+    return begin, begin + step
+
+
+def _to_bucket(begin: datetime, end: datetime) -> tuple[int, int]:
+    return round(begin.timestamp()), round(end.timestamp())
+
+
+def _aggregate(values: list[float], aggregation: Aggregation) -> float:
+    if not values:
+        return MISSING_VALUE
+
+    if aggregation == Aggregation.MEAN:
+        return fsum(values) / len(values)
+    if aggregation == Aggregation.MIN:
+        return min(values)
+    if aggregation == Aggregation.MAX:
+        return max(values)
+
+    return fsum(values)
+
+
+def _append(resampled: list[MeasurementItem], bucket: tuple[int, int], value: float) -> None:
+    begin, end = bucket
+    step = end - begin
+
+    previous = resampled[-1] if resampled else None
+    if previous is not None and previous.step_time == step and previous.end_time + step == begin:
+        previous.value.append(value)
+    else:
+        resampled.append(MeasurementItem.from_values(begin, step, array("d", [value])))
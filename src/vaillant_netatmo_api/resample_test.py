@@ -0,0 +1,66 @@
+import pytest
+
+from datetime import datetime
+
+from vaillant_netatmo_api.errors import UnsuportedArgumentsException
+from vaillant_netatmo_api.resample import Aggregation, resample
+from vaillant_netatmo_api.thermostat import MeasurementItem, MeasurementScale, MeasurementType
+
+
+def ts(*args) -> int:
+    return round(datetime(*args).timestamp())
+
+
+@pytest.mark.asyncio
+class TestResample:
+    async def test_resample__five_minute_temperatures__returns_hourly_means(self):
+        measurements = [MeasurementItem(ts(2022, 1, 15, 10, 0), 300, [[20]] * 12 + [[22]] * 6 + [[None]] * 6)]
+
+        resampled = resample(measurements, MeasurementScale.HOUR)
+
+        assert resampled == [MeasurementItem(ts(2022, 1, 15, 10, 0), 3600, [[20], [22]])]
+
+    async def test_resample__cumulative_type__returns_daily_sums(self):
+        measurements = [
+            MeasurementItem(ts(2022, 1, 15, 22, 0), 3600, [[600], [1200], [300]]),
+            MeasurementItem(ts(2022, 1, 16, 6, 0), 3600, [[900]]),
+        ]
+
+        resampled = resample(measurements, MeasurementScale.DAY, MeasurementType.SUM_BOILER_ON)
+
+        assert len(resampled) == 1
+        assert resampled[0].beg_time == ts(2022, 1, 15)
+        assert list(resampled[0].value) == [1800, 1200]
+
+    async def test_resample__provided_aggregation__returns_aggregated_values(self):
+        measurements = [MeasurementItem(ts(2022, 1, 15, 10, 0), 1800, [[20], [23], [21], [19]])]
+
+        assert list(resample(measurements, MeasurementScale.HOUR, aggregation=Aggregation.MIN)[0].value) == [20, 19]
+        assert list(resample(measurements, MeasurementScale.HOUR, aggregation=Aggregation.MAX)[0].value) == [23, 21]
+
+    async def test_resample__values_in_different_months__returns_calendar_months(self):
+        measurements = [MeasurementItem(ts(2022, 1, 31), 86400, [[10], [20], [30]])]
+
+        resampled = resample(measurements, MeasurementScale.MONTH, aggregation=Aggregation.SUM)
+
+        assert [m.beg_time for m in resampled] == [ts(2022, 1, 1), ts(2022, 2, 1)]
+        assert [m.step_time for m in resampled] == [ts(2022, 2, 1) - ts(2022, 1, 1), ts(2022, 3, 1) - ts(2022, 2, 1)]
+        assert [list(m.value) for m in resampled] == [[10], [50]]
+
+    async def test_resample__values_in_different_weeks__returns_weeks_starting_on_monday(self):
+        measurements = [MeasurementItem(ts(2022, 1, 16), 86400, [[10], [20]])]
+
+        resampled = resample(measurements, MeasurementScale.WEEK)
+
+        assert list(resampled[0].timestamps) == [ts(2022, 1, 10), ts(2022, 1, 17)]
+
+    async def test_resample__gap_between_values__leaves_out_empty_intervals(self):
+        measurements = [MeasurementItem(ts(2022, 1, 15, 10, 0), 3600, [[20]]), MeasurementItem(ts(2022, 1, 15, 13, 0), 3600, [[21]])]
+
+        resampled = resample(measurements, MeasurementScale.HOUR)
+
+        assert resampled == measurements
+
+    async def test_resample__max_scale__raises_error(self):
+        with pytest.raises(UnsuportedArgumentsException):
+            resample([], MeasurementScale.MAX)
@@ -0,0 +1,228 @@
+"""Module containing a configurable retry policy for the Netatmo API requests."""
+
+from __future__ import annotations
+
+from enum import Enum
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception, stop_after_attempt, stop_after_delay, wait_random_exponential
+
+from .errors import ApiException, CircuitBreakerOpenException, RequestBackoffException, RetryableException
+
+
+class RetryBudget:
+    """
+    Retry budget limiting the ratio of retries to requests, shared by all the requests using it.
+
+    Every request deposits ratio of a retry into the budget and every retry withdraws one retry from it. The budget starts full and is capped at capacity,
+    so healthy periods can't build up an unbounded amount of retries for the next outage.
+    """
+
+    def __init__(self, ratio: float = 0.1, capacity: int = 10) -> None:
+        """Create new retry budget allowing ratio retries per request, with at most capacity retries available at once."""
+
+        self.ratio = ratio
+        self.capacity = capacity
+
+        self._balance = float(capacity)
+
+    @property
+    def remaining(self) -> int:
+        """Returns a number of retries which can be made right now."""
+
+        return int(self._balance)
+
+    def deposit(self) -> None:
+        """Records a new request."""
+
+        self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Records a new retry. Returns False if there is no budget left and the request should not be retried."""
+
+        if self._balance < 1:
+            return False
+
+        self._balance -= 1
+        return True
+
+
+class CircuitState(Enum):
+    """CircuitState enumeration representing possible states of the circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker which stops sending requests after consecutive failures.
+
+    After failure threshold consecutive failures the circuit opens and requests fail fast. Once recovery timeout passes, one probe request is let through,
+    and the circuit closes again if it succeeds or opens for another recovery timeout if it fails.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        """Create new circuit breaker instance in the closed state."""
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and monotonic() - self._opened_at >= self.recovery_timeout:
+            return CircuitState.HALF_OPEN
+
+        return self._state
+
+    def before_request(self) -> None:
+        """Checks if the request can be sent. If the circuit is open, throws an exception."""
+
+        state = self.state
+
+        if state == CircuitState.CLOSED:
+            return
+
+        if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = True
+            return
+
+        raise CircuitBreakerOpenException("API is failing and circuit breaker is open. Try again after the recovery timeout.", state=state.value, failures=self._failures)
+
+    def record_success(self) -> None:
+        """Records a request which reached the API, closing the circuit."""
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Records a failed request, opening the circuit if the failure threshold is reached or if the probe request failed."""
+
+        self._failures += 1
+
+        if self._state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = CircuitState.OPEN
+            self._opened_at = monotonic()
+
+        self._probe_in_flight = False
+
+    def release(self) -> None:
+        """Records a request which ended without an outcome (ie. it was cancelled), letting another probe request through."""
+
+        self._probe_in_flight = False
+
+
+class RetryPolicy:
+    """
+    Retry policy used by the clients for retrying failed requests.
+
+    Retryable exceptions are retried with exponential backoff and random jitter, for up to max attempts or max delay seconds. If the API responds with
+    a Retry-After header, the request is retried after the given delay instead, which also applies to 429 TOO MANY REQUESTS responses.
+    Optional retry budget and circuit breaker can be shared between multiple clients, to limit the load on the API while it is failing.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 10,
+        max_delay: float = 300,
+        backoff_multiplier: float = 1,
+        backoff_max: float = 30,
+        budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """Create new retry policy instance. Default values match the behaviour of the clients without a custom retry policy."""
+
+        self.max_attempts = max_attempts
+        self.max_delay = max_delay
+        self.budget = budget
+        self.circuit_breaker = circuit_breaker
+
+        self._stop = stop_after_delay(max_delay) | stop_after_attempt(max_attempts)
+        self._backoff = wait_random_exponential(multiplier=backoff_multiplier, max=backoff_max)
+
+    async def call(self, fn: Callable[[], Awaitable[Any]], deadline: float | None = None) -> Any:
+        """
+        Calls the provided coroutine function, retrying it according to the policy.
+
+        If deadline is provided, as a monotonic clock timestamp, the function is not retried and the policy doesn't wait after the deadline.
+        """
+
+        if self.budget is not None:
+            self.budget.deposit()
+
+        retrying = AsyncRetrying(
+            retry=retry_if_exception(self._should_retry),
+            stop=lambda retry_state: self._should_stop(retry_state, deadline),
+            wait=lambda retry_state: self._wait(retry_state, deadline),
+            reraise=True,
+        )
+
+        async for attempt in retrying:
+            with attempt:
+                result = await self._attempt(fn)
+
+        return result
+
+    async def _attempt(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        if self.circuit_breaker is None:
+            return await fn()
+
+        self.circuit_breaker.before_request()
+
+        try:
+            result = await fn()
+        except RetryableException:
+            self.circuit_breaker.record_failure()
+            raise
+        except ApiException:
+            self.circuit_breaker.record_success()
+            raise
+        except BaseException:
+            self.circuit_breaker.release()
+            raise
+
+        self.circuit_breaker.record_success()
+        return result
+
+    def _should_retry(self, e: BaseException) -> bool:
+        if isinstance(e, RetryableException):
+            return True
+
+        return isinstance(e, RequestBackoffException) and e.retry_after is not None
+
+    def _should_stop(self, retry_state: RetryCallState, deadline: float | None) -> bool:
+        if self._stop(retry_state):
+            return True
+
+        remaining = self.max_delay - retry_state.seconds_since_start
+        if deadline is not None:
+            remaining = min(remaining, deadline - monotonic())
+        if remaining <= 0:
+            return True
+
+        retry_after = getattr(retry_state.outcome.exception(), "retry_after", None)
+        if retry_after is not None and retry_after > remaining:
+            return True
+
+        return self.budget is not None and not self.budget.withdraw()
+
+    def _wait(self, retry_state: RetryCallState, deadline: float | None) -> float:
+        retry_after = getattr(retry_state.outcome.exception(), "retry_after", None)
+        if retry_after is not None:
+            wait = retry_after
+        else:
+            wait = self._backoff(retry_state)
+
+        if deadline is not None:
+            wait = max(0.0, min(wait, deadline - monotonic()))
+
+        return wait
@@ -0,0 +1,130 @@
+import httpx
+import pytest
+
+from datetime import timedelta
+
+from pytest_mock import MockerFixture
+
+from vaillant_netatmo_api.errors import CircuitBreakerOpenException, NetworkException, RequestBackoffException, RequestClientException
+from vaillant_netatmo_api.retry import CircuitBreaker, CircuitState, RetryBudget, RetryPolicy
+
+request = httpx.Request("POST", "https://api.netatmo.com/")
+
+
+def response(status_code: int, headers: dict = {}) -> httpx.Response:
+    r = httpx.Response(status_code, headers=headers, request=request)
+    r.elapsed = timedelta()
+    return r
+
+
+def failing(*errors):
+    calls = []
+
+    async def fn():
+        calls.append(len(calls))
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return fn, calls
+
+
+@pytest.mark.asyncio
+class TestRetryPolicy:
+    async def test_call__retryable_errors__retries_until_success(self):
+        fn, calls = failing(NetworkException("", request, None), NetworkException("", request, None))
+
+        result = await RetryPolicy(backoff_max=0).call(fn)
+
+        assert result == "ok"
+        assert len(calls) == 3
+
+    async def test_call__non_retryable_error__raises_error_without_retry(self):
+        fn, calls = failing(RequestClientException("", request, response(400)))
+
+        with pytest.raises(RequestClientException):
+            await RetryPolicy(backoff_max=0).call(fn)
+
+        assert len(calls) == 1
+
+    async def test_call__too_many_requests_with_retry_after__retries_after_delay(self):
+        fn, calls = failing(RequestBackoffException("", request, response(429, {"Retry-After": "0"})))
+
+        result = await RetryPolicy(backoff_max=0).call(fn)
+
+        assert result == "ok"
+        assert len(calls) == 2
+
+    async def test_call__too_many_requests_without_retry_after__raises_error_without_retry(self):
+        fn, calls = failing(RequestBackoffException("", request, response(429)))
+
+        with pytest.raises(RequestBackoffException):
+            await RetryPolicy(backoff_max=0).call(fn)
+
+        assert len(calls) == 1
+
+    async def test_call__retry_after_longer_than_max_delay__raises_error_without_retry(self):
+        fn, calls = failing(RequestBackoffException("", request, response(429, {"Retry-After": "600"})))
+
+        with pytest.raises(RequestBackoffException):
+            await RetryPolicy(backoff_max=0).call(fn)
+
+        assert len(calls) == 1
+
+    async def test_call__exhausted_retry_budget__raises_error_without_retry(self):
+        budget = RetryBudget(ratio=0.1, capacity=1)
+        fn, calls = failing(*[NetworkException("", request, None)] * 5)
+
+        with pytest.raises(NetworkException):
+            await RetryPolicy(backoff_max=0, budget=budget).call(fn)
+
+        assert len(calls) == 2
+        assert budget.remaining == 0
+
+    async def test_call__open_circuit_breaker__fails_fast(self):
+        circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        policy = RetryPolicy(backoff_max=0, circuit_breaker=circuit_breaker)
+        fn, calls = failing(*[NetworkException("", request, None)] * 5)
+
+        with pytest.raises(CircuitBreakerOpenException):
+            await policy.call(fn)
+
+        assert len(calls) == 2
+        assert circuit_breaker.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+class TestCircuitBreaker:
+    async def test_before_request__recovery_timeout_passed__lets_one_probe_through(self, mocker: MockerFixture):
+        mocker.patch("vaillant_netatmo_api.retry.monotonic", return_value=100)
+        circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        circuit_breaker.record_failure()
+
+        mocker.patch("vaillant_netatmo_api.retry.monotonic", return_value=130)
+
+        circuit_breaker.before_request()
+        with pytest.raises(CircuitBreakerOpenException):
+            circuit_breaker.before_request()
+
+    async def test_record_success__half_open_probe__closes_circuit(self, mocker: MockerFixture):
+        mocker.patch("vaillant_netatmo_api.retry.monotonic", return_value=100)
+        circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        circuit_breaker.record_failure()
+
+        mocker.patch("vaillant_netatmo_api.retry.monotonic", return_value=130)
+        circuit_breaker.before_request()
+        circuit_breaker.record_success()
+
+        assert circuit_breaker.state == CircuitState.CLOSED
+        circuit_breaker.before_request()
+
+    async def test_record_failure__half_open_probe__opens_circuit_again(self, mocker: MockerFixture):
+        mocker.patch("vaillant_netatmo_api.retry.monotonic", return_value=100)
+        circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        circuit_breaker.record_failure()
+
+        mocker.patch("vaillant_netatmo_api.retry.monotonic", return_value=130)
+        circuit_breaker.before_request()
+        circuit_breaker.record_failure()
+
+        assert circuit_breaker.state == CircuitState.OPEN
@@ -0,0 +1,91 @@
+"""Module containing simulation of thermostat setpoints from their schedules."""
+
+from __future__ import annotations
+
+from array import array
+from datetime import datetime, timedelta
+
+from .thermostat import MISSING_VALUE, MeasurementItem, Module, Program, Setpoint
+
+_DEFAULT_STEP = timedelta(minutes=5)
+_AWAY_ZONE_ID = 2
+
+
+def simulate_setpoints(
+    modules: list[Module],
+    start: datetime,
+    end: datetime,
+    step: timedelta = _DEFAULT_STEP,
+) -> dict[str, MeasurementItem]:
+    """
+    Simulate setpoint temperatures of the modules over the [start, end) range, on a time grid with the provided step.
+
+    Setpoints follow the selected program of each module, with active manual and away setpoints applied from the start of the range until their end time.
+    The manual setpoint takes precedence over the away setpoint. Returns a measurement item with the setpoint temperatures for each module, keyed by module id,
+    with missing values where no zone of the program applies.
+    """
+
+    return {module.id: simulate_module_setpoints(module, start, end, step) for module in modules}
+
+
+def simulate_module_setpoints(
+    module: Module,
+    start: datetime,
+    end: datetime,
+    step: timedelta = _DEFAULT_STEP,
+) -> MeasurementItem:
+    """Simulate setpoint temperatures of the module over the [start, end) range, on a time grid with the provided step."""
+
+    count = max(0, _get_index(end - start, step))
+    values = array("d", [MISSING_VALUE]) * count
+
+    program = _get_selected_program(module.therm_program_list)
+    if program is not None:
+        _fill_program(values, program, start, end, step)
+
+        away_zone = next((zone for zone in program.zones if zone.id == _AWAY_ZONE_ID), None)
+        if away_zone is not None:
+            _fill_setpoint(values, module.setpoint_away, away_zone.temp, start, step)
+
+    _fill_setpoint(values, module.setpoint_manual, module.setpoint_manual.setpoint_temp, start, step)
+
+    return MeasurementItem.from_values(round(start.timestamp()), round(step.total_seconds()), values)
+
+
+def _get_selected_program(programs: list[Program]) -> Program | None:
+    for program in programs:
+        if program.selected:
+            return program
+
+    return programs[0] if programs else None
+
+
+def _fill_program(values: array, program: Program, start: datetime, end: datetime, step: timedelta) -> None:
+    segments = [(start, program.active_zone_at(start))]
+    segments.extend([(slot_start, program.active_zone_at(slot_start)) for slot_start, _ in program.slots_between(start, end)])
+
+    for (segment_start, zone), (segment_end, _) in zip(segments, segments[1:] + [(end, None)]):
+        if zone is not None:
+            _fill(values, _get_index(segment_start - start, step), _get_index(segment_end - start, step), zone.temp)
+
+
+def _fill_setpoint(values: array, setpoint: Setpoint, temp: float | None, start: datetime, step: timedelta) -> None:
+    if not setpoint.setpoint_activate or temp is None:
+        return
+
+    end_index = len(values) if setpoint.setpoint_endtime is None else _get_index(setpoint.setpoint_endtime - start, step)
+    _fill(values, 0, end_index, temp)
+
+
+def _fill(values: array, start_index: int, end_index: int, value: float) -> None:
+    start_index = max(0, start_index)
+    end_index = min(len(values), end_index)
+
+    if start_index < end_index:
+        values[start_index:end_index] = array("d", [value]) * (end_index - start_index)
+
+
+def _get_index(offset: timedelta, step: timedelta) -> int:
+    """Returns an index of the first grid point at or after the provided offset from the start of the grid."""
+
+    return -(-offset // step)
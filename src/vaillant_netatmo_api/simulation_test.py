@@ -0,0 +1,68 @@
+import pytest
+
+from datetime import datetime, timedelta
+from math import isnan
+
+from vaillant_netatmo_api.simulation import simulate_module_setpoints, simulate_setpoints
+from vaillant_netatmo_api.thermostat import Module
+
+start = datetime(2021, 11, 22, 0, 0)
+end = datetime(2021, 11, 22, 4, 0)
+step = timedelta(hours=1)
+
+program = {
+    "program_id": "program",
+    "selected": True,
+    "zones": [{"id": 0, "temp": 20}, {"id": 1, "temp": 17}, {"id": 2, "temp": 12}],
+    "timetable": [{"id": 1, "m_offset": 60}, {"id": 0, "m_offset": 150}],
+}
+
+
+@pytest.mark.asyncio
+class TestSimulation:
+    async def test_simulate_setpoints__modules_without_overrides__returns_program_setpoints(self):
+        modules = [
+            Module(_id="module1", therm_program_list=[program]),
+            Module(_id="module2"),
+        ]
+
+        setpoints = simulate_setpoints(modules, start, end, step)
+
+        assert setpoints["module1"].beg_time == round(start.timestamp())
+        assert setpoints["module1"].step_time == 3600
+        assert list(setpoints["module1"].value) == [20, 17, 17, 20]
+        assert len(setpoints["module2"]) == 4
+        assert all(isnan(value) for value in setpoints["module2"].value)
+
+    async def test_simulate_module_setpoints__active_away_setpoint__returns_away_temperature_until_end_time(self):
+        module = Module(
+            therm_program_list=[program],
+            setpoint_away={"setpoint_activate": True, "setpoint_endtime": round(datetime(2021, 11, 22, 2, 0).timestamp())},
+        )
+
+        setpoints = simulate_module_setpoints(module, start, end, step)
+
+        assert list(setpoints.value) == [12, 12, 17, 20]
+
+    async def test_simulate_module_setpoints__active_manual_setpoint__returns_manual_temperature(self):
+        module = Module(
+            therm_program_list=[program],
+            setpoint_away={"setpoint_activate": True},
+            setpoint_manual={"setpoint_activate": True, "setpoint_endtime": round(datetime(2021, 11, 22, 1, 0).timestamp()), "setpoint_temp": 23},
+        )
+
+        setpoints = simulate_module_setpoints(module, start, end, step)
+
+        assert list(setpoints.value) == [23, 12, 12, 12]
+
+    async def test_simulate_module_setpoints__ranges_from_before_and_after_week_boundary__agree_on_overlap(self):
+        module = Module(therm_program_list=[{
+            **program,
+            "timetable": [{"id": 0, "m_offset": 60}, {"id": 1, "m_offset": 10020}],
+        }])
+
+        from_sunday = simulate_module_setpoints(module, datetime(2021, 11, 28, 22, 0), datetime(2021, 11, 29, 2, 0), step)
+        from_monday = simulate_module_setpoints(module, datetime(2021, 11, 29, 0, 0), datetime(2021, 11, 29, 2, 0), step)
+
+        assert list(from_sunday.value) == [20, 17, 17, 20]
+        assert list(from_monday.value) == [17, 20]
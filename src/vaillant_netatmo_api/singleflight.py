@@ -0,0 +1,47 @@
+"""Module containing a helper for coalescing concurrent identical requests."""
+
+from __future__ import annotations
+
+import asyncio
+
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one in-flight call.
+
+    The first caller for a key starts the call, every other caller which arrives while it is still running awaits the same result or exception.
+    Once the call finishes, the key is released and the next caller starts a new call.
+    """
+
+    def __init__(self) -> None:
+        """Create new single flight instance with no calls in flight."""
+
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run the provided coroutine function, or join the call which is already in flight for the same key.
+
+        Cancelling one of the callers doesn't cancel the shared call for the others.
+        """
+
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda f: self._release(key, f))
+
+        return await asyncio.shield(future)
+
+    def _release(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+
+        # Mark the exception as retrieved in case all the callers were cancelled.
+        if not future.cancelled():
+            future.exception()
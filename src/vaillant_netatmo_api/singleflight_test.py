@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from vaillant_netatmo_api.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    async def test_run__concurrent_calls_with_same_key__executes_once(self):
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        single_flight = SingleFlight()
+
+        results = await asyncio.gather(*[single_flight.run("key", fn) for _ in range(10)])
+
+        assert calls == 1
+        assert results == [1] * 10
+        assert len(single_flight) == 0
+
+    async def test_run__concurrent_calls_with_different_keys__executes_each(self):
+        calls = []
+
+        def fn(key):
+            async def inner():
+                calls.append(key)
+                await asyncio.sleep(0.01)
+                return key
+            return inner
+
+        single_flight = SingleFlight()
+
+        results = await asyncio.gather(single_flight.run("a", fn("a")), single_flight.run("b", fn("b")))
+
+        assert sorted(calls) == ["a", "b"]
+        assert results == ["a", "b"]
+
+    async def test_run__failing_call__raises_error_for_all_callers_and_releases_key(self):
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise ValueError()
+
+        single_flight = SingleFlight()
+
+        results = await asyncio.gather(*[single_flight.run("key", fn) for _ in range(3)], return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert len(single_flight) == 0
+
+    async def test_run__cancelled_caller__doesnt_cancel_other_callers(self):
+        async def fn():
+            await asyncio.sleep(0.01)
+            return "result"
+
+        single_flight = SingleFlight()
+
+        first = asyncio.ensure_future(single_flight.run("key", fn))
+        second = asyncio.ensure_future(single_flight.run("key", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "result"
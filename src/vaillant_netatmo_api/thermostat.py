@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
 from contextlib import asynccontextmanager
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from enum import Enum
-from typing import AsyncGenerator, Callable
-
-from httpx import AsyncClient
-
-from .base import BaseClient
-from .errors import NonOkResponseException, UnsuportedArgumentsException
-from .thermostat_auth import ThermostatAuth
+from math import isnan
+from typing import AsyncGenerator, Awaitable, Callable, TypeVar
+
+from httpx import AsyncClient, Timeout
+
+from .base import BaseClient, JsonDecoder
+from .cache import ResponseCache
+from .errors import DeadlineExceededException, NonOkResponseException, UnsuportedArgumentsException
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .thermostat_auth import DEFAULT_REFRESH_SKEW_SECONDS, ThermostatAuth
 from .time import now
 from .token import Token, TokenStore
 
@@ -28,6 +37,14 @@ _VAILLANT_DATA_AMOUNT = "app"
 _VAILLANT_SYNC_DEVICE_ID = "all"
 _RESPONSE_STATUS_OK = "ok"
 _SETPOINT_DEFAULT_DURATION_MINS = 120
+_GET_MEASURE_MAX_POINTS = 1024
+_GET_MEASURE_MAX_CONCURRENCY = 4
+_GET_MEASURE_READ_AHEAD = 2
+
+T = TypeVar("T")
+
+# Missing values of measurements are stored as NaN in the arrays of doubles.
+MISSING_VALUE = float("nan")
 
 
 @asynccontextmanager
@@ -36,8 +53,17 @@ async def thermostat_client(
     client_secret: str,
     token: Token,
     on_token_update: Callable[[Token], None],
+    client: AsyncClient | None = None,
 ) -> AsyncGenerator[ThermostatClient, None]:
-    client = AsyncClient()
+    """
+    Create new thermostat client for the duration of the context.
+
+    If client is provided (ie. from a shared ClientPool), it is used for making requests and is not closed when the context exits.
+    """
+
+    owns_client = client is None
+    if owns_client:
+        client = AsyncClient()
     token_store = TokenStore(client_id, client_secret, token, on_token_update)
 
     c = ThermostatClient(client, token_store)
@@ -45,7 +71,8 @@ async def thermostat_client(
     try:
         yield c
     finally:
-        await client.aclose()
+        if owns_client:
+            await client.aclose()
 
 
 class ThermostatClient(BaseClient):
@@ -59,22 +86,75 @@ class ThermostatClient(BaseClient):
         self,
         client: AsyncClient,
         token_store: TokenStore,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        token_refresh_skew: float = DEFAULT_REFRESH_SKEW_SECONDS,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        timeouts: dict[str, Timeout] | None = None,
+        json_decoder: JsonDecoder | None = None,
+        lazy: bool = False,
+        typed_decoding: bool = False,
     ) -> None:
         """
         Create new thermostat client instance.
 
         Uses the provided parameters to instantiate the BaseClient class.
+        When single flight is enabled, concurrent reads of the thermostat data share one in-flight request and its parsed result.
+        When cache is provided, thermostat data is served from the cache and any write invalidates the cached data of the written device.
+        The cache should not be shared between clients of different accounts.
+        Access token is refreshed once it expires within token refresh skew seconds.
+        All the API methods accept a deadline in seconds, which covers the request and all of its retries.
+        When lazy is set, modules, programs and timetables of the returned devices are built on first access.
+        When typed decoding is set, thermostat data and measurements are decoded by msgspec into typed structs, which validates their types, and the models
+        are built from the structs without intermediate dicts. It requires msgspec to be installed, and it builds the models right away, so lazy has no effect with it.
         """
 
-        super().__init__(client, ThermostatAuth(token_store))
+        super().__init__(client, ThermostatAuth(token_store, token_refresh_skew), rate_limiter, retry_policy, timeouts, json_decoder)
+
+        self._single_flight = SingleFlight() if single_flight else None
+        self._cache = cache
+        self._lazy = lazy
+        self._thermostats_data_decoder: JsonDecoder | None = None
+        self._measure_decoder: JsonDecoder | None = None
+
+        if typed_decoding:
+            from .typed_decoding import decode_measure, decode_thermostats_data
+
+            self._thermostats_data_decoder = decode_thermostats_data
+            self._measure_decoder = decode_measure
 
-    async def async_get_thermostats_data(self) -> list[Device]:
+    async def async_get_thermostats_data(self, deadline: float | None = None) -> list[Device]:
         """
         Get thermostat data from the Netatmo API.
 
         On success, returns a list of thermostat devices with their modules. On error, throws an exception.
         """
 
+        if self._cache is not None:
+            devices = self._cache.get(_GET_THERMOSTATS_DATA_PATH)
+            if devices is not None:
+                return devices
+
+        if self._single_flight is not None:
+            # The shared call runs without a deadline, so each caller which joins it only waits for as long as its own deadline allows.
+            flight = self._single_flight.run(_GET_THERMOSTATS_DATA_PATH, lambda: self._async_get_cached_thermostats_data(None))
+
+            return await _async_wait_for_deadline(flight, deadline, _GET_THERMOSTATS_DATA_PATH)
+
+        return await self._async_get_cached_thermostats_data(deadline)
+
+    async def _async_get_cached_thermostats_data(self, deadline: float | None) -> list[Device]:
+        if self._cache is None:
+            return await self._async_get_thermostats_data(deadline)
+
+        generation = self._cache.generation
+        devices = await self._async_get_thermostats_data(deadline)
+        self._cache.set(_GET_THERMOSTATS_DATA_PATH, devices, [device.id for device in devices], generation)
+
+        return devices
+
+    async def _async_get_thermostats_data(self, deadline: float | None) -> list[Device]:
         path = _GET_THERMOSTATS_DATA_PATH
         data = {
             "device_type": _VAILLANT_DEVICE_TYPE,
@@ -82,15 +162,44 @@ class ThermostatClient(BaseClient):
             "sync_device_id": _VAILLANT_SYNC_DEVICE_ID,
         }
 
+        if self._thermostats_data_decoder is not None:
+            response = await self._post(
+                path,
+                data=data,
+                deadline=deadline,
+                decoder=self._thermostats_data_decoder,
+            )
+
+            if response.status != _RESPONSE_STATUS_OK:
+                raise NonOkResponseException("Unknown response error. Check the log for more details.", path=path, data=data, body=response)
+
+            return response.to_devices()
+
         body = await self._post(
             path,
             data=data,
+            deadline=deadline,
         )
 
         if body["status"] != _RESPONSE_STATUS_OK:
             raise NonOkResponseException("Unknown response error. Check the log for more details.", path=path, data=data, body=body)
 
-        return [Device(**device) for device in body["body"]["devices"]]
+        return [Device.from_dict(device, self._lazy) for device in body["body"]["devices"]]
+
+    async def async_get_thermostats_data_raw(self, deadline: float | None = None, as_bytes: bool = False) -> dict | bytes:
+        """
+        Get thermostat data from the Netatmo API, without building the models. Doesn't use the cache or single flight.
+
+        On success, returns the decoded response, or the raw response content if as bytes is set. On error, throws an exception.
+        """
+
+        data = {
+            "device_type": _VAILLANT_DEVICE_TYPE,
+            "data_amount": _VAILLANT_DATA_AMOUNT,
+            "sync_device_id": _VAILLANT_SYNC_DEVICE_ID,
+        }
+
+        return await self._async_post_raw(_GET_THERMOSTATS_DATA_PATH, data, deadline, as_bytes)
 
     async def async_get_measure(
         self,
@@ -101,42 +210,265 @@ class ThermostatClient(BaseClient):
         date_begin: datetime,
         date_end: datetime | None = None,
         limit: int | None = None,
+        deadline: float | None = None,
+        max_concurrency: int = _GET_MEASURE_MAX_CONCURRENCY,
     ) -> list[MeasurementItem]:
         """
         Get real time measurement data from the Netatmo API.
 
+        If both date begin and date end are provided without a limit, ranges longer than the API allows in one request are split into windows,
+        which are fetched with up to max concurrency requests at once and stitched into one contiguous list of measurements. The deadline covers
+        the requests of all the windows.
+
         On success, returns a list of measurements for provided measurement type. On error, throws an exception.
         """
 
+        begin = round(date_begin.timestamp())
+        end = None if date_end is None else round(date_end.timestamp())
+
+        if end is None or limit is not None:
+            windows = [(begin, end)]
+        else:
+            windows = get_measure_windows(scale, begin, end)
+
+        if len(windows) == 1:
+            measurements = await self._async_get_measure_window(device_id, module_id, [type], scale, windows[0], limit, deadline)
+            return [MeasurementItem(beg_time, step_time, rows) for beg_time, step_time, rows in measurements]
+
+        chunks = await _async_wait_for_deadline(
+            self._async_collect_measure_chunks(device_id, module_id, type, scale, date_begin, date_end, deadline, max_concurrency),
+            deadline,
+            _GET_MEASURE_PATH,
+        )
+
+        return merge_measurement_items([measurement for chunk in chunks for measurement in chunk])
+
+    async def async_get_measures(
+        self,
+        device_id: str,
+        module_id: str,
+        types: list[MeasurementType],
+        scale: MeasurementScale,
+        date_begin: datetime,
+        date_end: datetime | None = None,
+        limit: int | None = None,
+        deadline: float | None = None,
+        max_concurrency: int = _GET_MEASURE_MAX_CONCURRENCY,
+    ) -> dict[MeasurementType, list[MeasurementItem]]:
+        """
+        Get real time measurement data for multiple measurement types from the Netatmo API, using one request for all the types.
+
+        Long ranges are split into windows the same way as in async_get_measure, and the deadline covers the requests of all the windows.
+        Measurements of all the types share the same time axis.
+
+        On success, returns a list of measurements for each of the provided measurement types. On error, throws an exception.
+        """
+
+        begin = round(date_begin.timestamp())
+        end = None if date_end is None else round(date_end.timestamp())
+
+        if end is None or limit is not None:
+            windows = [(begin, end)]
+        else:
+            windows = get_measure_windows(scale, begin, end)
+
+        columns = await _async_wait_for_deadline(
+            self._async_collect_measure_columns(device_id, module_id, types, scale, windows, limit, deadline, max_concurrency),
+            deadline,
+            _GET_MEASURE_PATH,
+        )
+
+        return {type: merge_measurement_items(measurement_items) for type, measurement_items in columns.items()}
+
+    async def async_get_measure_raw(
+        self,
+        device_id: str,
+        module_id: str,
+        type: MeasurementType,
+        scale: MeasurementScale,
+        date_begin: datetime,
+        date_end: datetime | None = None,
+        limit: int | None = None,
+        deadline: float | None = None,
+        as_bytes: bool = False,
+    ) -> dict | bytes:
+        """
+        Get real time measurement data from the Netatmo API, without building the models. The range is fetched in one request, without splitting it into windows.
+
+        On success, returns the decoded response, or the raw response content if as bytes is set. On error, throws an exception.
+        """
+
+        return await self.async_get_measures_raw(device_id, module_id, [type], scale, date_begin, date_end, limit, deadline, as_bytes)
+
+    async def async_get_measures_raw(
+        self,
+        device_id: str,
+        module_id: str,
+        types: list[MeasurementType],
+        scale: MeasurementScale,
+        date_begin: datetime,
+        date_end: datetime | None = None,
+        limit: int | None = None,
+        deadline: float | None = None,
+        as_bytes: bool = False,
+    ) -> dict | bytes:
+        """
+        Get real time measurement data of multiple types from the Netatmo API in one request, without building the models.
+
+        On success, returns the decoded response, or the raw response content if as bytes is set. On error, throws an exception.
+        """
+
+        begin = round(date_begin.timestamp())
+        end = None if date_end is None else round(date_end.timestamp())
+        data = _get_measure_data(device_id, module_id, types, scale, begin, end, limit)
+
+        return await self._async_post_raw(_GET_MEASURE_PATH, data, deadline, as_bytes)
+
+    async def async_iter_measure(
+        self,
+        device_id: str,
+        module_id: str,
+        type: MeasurementType,
+        scale: MeasurementScale,
+        date_begin: datetime,
+        date_end: datetime | None = None,
+        deadline: float | None = None,
+        read_ahead: int = _GET_MEASURE_READ_AHEAD,
+    ) -> AsyncGenerator[list[MeasurementItem], None]:
+        """
+        Get real time measurement data from the Netatmo API, one window of the range at a time.
+
+        Splits the range into windows which fit into one request and yields measurements of each window, in order, as soon as they arrive.
+        Up to read ahead windows are fetched while the previous ones are being consumed. Values already yielded by the previous window are dropped.
+        If deadline is provided, it applies to each of the requests.
+
+        On success, yields lists of measurements for provided measurement type. On error, throws an exception.
+        """
+
+        begin = round(date_begin.timestamp())
+        end = round((date_end if date_end is not None else now()).timestamp())
+
+        windows = get_measure_windows(scale, begin, end)
+        last_time = None
+
+        async for measurements in self._async_iter_measure_windows(device_id, module_id, [type], scale, windows, None, deadline, read_ahead):
+            chunk = merge_measurement_items([MeasurementItem(beg_time, step_time, rows) for beg_time, step_time, rows in measurements], last_time)
+            if not chunk:
+                continue
+
+            last_time = chunk[-1].end_time
+            yield chunk
+
+    async def _async_collect_measure_chunks(
+        self,
+        device_id: str,
+        module_id: str,
+        type: MeasurementType,
+        scale: MeasurementScale,
+        date_begin: datetime,
+        date_end: datetime | None,
+        deadline: float | None,
+        max_concurrency: int,
+    ) -> list[list[MeasurementItem]]:
+        return [
+            chunk
+            async for chunk in self.async_iter_measure(device_id, module_id, type, scale, date_begin, date_end, deadline, read_ahead=max_concurrency)
+        ]
+
+    async def _async_collect_measure_columns(
+        self,
+        device_id: str,
+        module_id: str,
+        types: list[MeasurementType],
+        scale: MeasurementScale,
+        windows: list[tuple[int, int | None]],
+        limit: int | None,
+        deadline: float | None,
+        max_concurrency: int,
+    ) -> dict[MeasurementType, list[MeasurementItem]]:
+        columns: dict[MeasurementType, list[MeasurementItem]] = {type: [] for type in types}
+
+        async for measurements in self._async_iter_measure_windows(device_id, module_id, types, scale, windows, limit, deadline, max_concurrency):
+            for measurement in measurements:
+                for type, measurement_item in zip(types, _split_measurement_columns(measurement, len(types))):
+                    columns[type].append(measurement_item)
+
+        return columns
+
+    async def _async_iter_measure_windows(
+        self,
+        device_id: str,
+        module_id: str,
+        types: list[MeasurementType],
+        scale: MeasurementScale,
+        windows: list[tuple[int, int | None]],
+        limit: int | None,
+        deadline: float | None,
+        read_ahead: int,
+    ) -> AsyncGenerator[list[tuple], None]:
+        pending = deque(windows)
+        tasks: deque[asyncio.Future] = deque()
+
+        try:
+            while pending or tasks:
+                while pending and len(tasks) < max(read_ahead, 1):
+                    tasks.append(asyncio.ensure_future(
+                        self._async_get_measure_window(device_id, module_id, types, scale, pending.popleft(), limit, deadline)
+                    ))
+
+                yield await tasks.popleft()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _async_get_measure_window(
+        self,
+        device_id: str,
+        module_id: str,
+        types: list[MeasurementType],
+        scale: MeasurementScale,
+        window: tuple[int, int | None],
+        limit: int | None,
+        deadline: float | None,
+    ) -> list[tuple]:
+        """Returns the begin time, the step and the rows of values of each measurement of the window."""
+
+        date_begin, date_end = window
+
         path = _GET_MEASURE_PATH
-        data = {
-            "device_id": device_id,
-            "module_id": module_id,
-            "type": type.value,
-            "scale": scale.value,
-            "date_begin": round(date_begin.timestamp()),
-        }
+        data = _get_measure_data(device_id, module_id, types, scale, date_begin, date_end, limit)
 
-        if date_end is not None:
-            data["date_end"] = round(date_end.timestamp())
-        if limit is not None:
-            data["limit"] = limit
+        if self._measure_decoder is not None:
+            response = await self._post(
+                path,
+                data=data,
+                deadline=deadline,
+                decoder=self._measure_decoder,
+            )
+
+            if response.status != _RESPONSE_STATUS_OK:
+                raise NonOkResponseException("Unknown response error. Check the log for more details.", path=path, data=data, body=response)
+
+            return response.to_measurement_rows()
 
         body = await self._post(
             path,
             data=data,
+            deadline=deadline,
         )
 
         if body["status"] != _RESPONSE_STATUS_OK:
             raise NonOkResponseException("Unknown response error. Check the log for more details.", path=path, data=data, body=body)
 
-        return [
-            MeasurementItem(**measurement)
-            for measurement in body["body"]
-        ]
+        return [(measurement.get("beg_time"), measurement.get("step_time"), measurement.get("value", [])) for measurement in body["body"]]
 
     async def async_set_system_mode(
-        self, device_id: str, module_id: str, system_mode: SystemMode
+        self,
+        device_id: str,
+        module_id: str,
+        system_mode: SystemMode,
+        deadline: float | None = None,
     ) -> None:
         """
         Change the thermostat's system mode to the provided value.
@@ -151,10 +483,14 @@ class ThermostatClient(BaseClient):
             "system_mode": system_mode.value,
         }
 
-        body = await self._post(
-            path,
-            data=data,
-        )
+        try:
+            body = await self._post(
+                path,
+                data=data,
+                deadline=deadline,
+            )
+        finally:
+            self._invalidate_cache(device_id)
 
         if body["status"] != _RESPONSE_STATUS_OK:
             raise NonOkResponseException("Unknown response error. Check the log for more details.", path=path, data=data, body=body)
@@ -167,6 +503,7 @@ class ThermostatClient(BaseClient):
         activate: bool,
         setpoint_endtime: datetime | None = None,
         setpoint_temp: float | None = None,
+        deadline: float | None = None,
     ) -> None:
         """
         Activate or deactivate thermostat's minor mode, for the provided duration and temperature.
@@ -190,10 +527,14 @@ class ThermostatClient(BaseClient):
         if temp is not None:
             data["setpoint_temp"] = temp
 
-        body = await self._post(
-            path,
-            data=data,
-        )
+        try:
+            body = await self._post(
+                path,
+                data=data,
+                deadline=deadline,
+            )
+        finally:
+            self._invalidate_cache(device_id)
 
         if body["status"] != _RESPONSE_STATUS_OK:
             raise NonOkResponseException("Unknown response error. Check the log for more details.", path=path, data=data, body=body)
@@ -206,6 +547,7 @@ class ThermostatClient(BaseClient):
         name: str,
         zones: list[Zone],
         timetable: list[TimeSlot],
+        deadline: float | None = None,
     ) -> None:
         """
         Change thermostat's schedule, by providing all the data for the given schedule. The method upserts all the schedule data, it
@@ -232,10 +574,14 @@ class ThermostatClient(BaseClient):
                 } for time_slot in timetable]),
         }
 
-        body = await self._post(
-            path,
-            data=data,
-        )
+        try:
+            body = await self._post(
+                path,
+                data=data,
+                deadline=deadline,
+            )
+        finally:
+            self._invalidate_cache(device_id)
 
         if body["status"] != _RESPONSE_STATUS_OK:
             raise NonOkResponseException("Unknown response error. Check the log for more details.", path=path, data=data, body=body)
@@ -245,6 +591,7 @@ class ThermostatClient(BaseClient):
         device_id: str,
         module_id: str,
         schedule_id: str,
+        deadline: float | None = None,
     ) -> None:
         """
         Change the thermostat's active schedule to the provided value.
@@ -259,14 +606,34 @@ class ThermostatClient(BaseClient):
             "schedule_id": schedule_id,
         }
 
-        body = await self._post(
+        try:
+            body = await self._post(
+                path,
+                data=data,
+                deadline=deadline,
+            )
+        finally:
+            self._invalidate_cache(device_id)
+
+        if body["status"] != _RESPONSE_STATUS_OK:
+            raise NonOkResponseException("Unknown response error. Check the log for more details.", path=path, data=data, body=body)
+
+    async def _async_post_raw(self, path: str, data: dict, deadline: float | None, as_bytes: bool) -> dict | bytes:
+        body, content = await self._post_with_content(
             path,
             data=data,
+            deadline=deadline,
         )
 
         if body["status"] != _RESPONSE_STATUS_OK:
             raise NonOkResponseException("Unknown response error. Check the log for more details.", path=path, data=data, body=body)
 
+        return content if as_bytes else body
+
+    def _invalidate_cache(self, device_id: str) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(device_id)
+
     def _get_setpoint_endtime(
         self,
         setpoint_mode: SetpointMode,
@@ -308,9 +675,123 @@ class ThermostatClient(BaseClient):
                 return setpoint_temp
 
 
+def _get_measure_data(
+    device_id: str,
+    module_id: str,
+    types: list[MeasurementType],
+    scale: MeasurementScale,
+    date_begin: int,
+    date_end: int | None,
+    limit: int | None,
+) -> dict:
+    data = {
+        "device_id": device_id,
+        "module_id": module_id,
+        "type": ",".join([type.value for type in types]),
+        "scale": scale.value,
+        "date_begin": date_begin,
+    }
+
+    if date_end is not None:
+        data["date_end"] = date_end
+    if limit is not None:
+        data["limit"] = limit
+
+    return data
+
+
+async def _async_wait_for_deadline(awaitable: Awaitable[T], deadline: float | None, path: str) -> T:
+    """Waits for the awaitable for at most deadline seconds, so the deadline covers all the requests it makes."""
+
+    if deadline is None:
+        return await awaitable
+
+    try:
+        return await asyncio.wait_for(awaitable, deadline)
+    except asyncio.TimeoutError as e:
+        raise DeadlineExceededException("Deadline passed while waiting for the responses. Retry the request with longer deadline.", path=path) from e
+
+
+def get_measure_windows(scale: MeasurementScale, date_begin: int, date_end: int) -> list[tuple[int, int]]:
+    """Splits the time range into windows of the provided scale, each small enough to be fetched with one measurement request."""
+
+    window = MEASUREMENT_SCALE_SECONDS[scale] * _GET_MEASURE_MAX_POINTS
+
+    return [
+        (window_begin, min(window_begin + window - 1, date_end))
+        for window_begin in range(date_begin, date_end + 1, window)
+    ]
+
+
+def _split_measurement_columns(measurement: tuple, count: int) -> list[MeasurementItem]:
+    """Splits a measurement of multiple types, with one value per type in each row, into a measurement item per type."""
+
+    beg_time, step_time, rows = measurement
+
+    return [
+        MeasurementItem.from_values(beg_time, step_time, array("d", [
+            row[column] if column < len(row) and row[column] is not None else MISSING_VALUE
+            for row in rows
+        ]))
+        for column in range(count)
+    ]
+
+
+def merge_measurement_items(measurements: list[MeasurementItem], last_time: int | None = None) -> list[MeasurementItem]:
+    """
+    Sorts measurements by time, drops values which were already returned by overlapping windows and joins adjacent runs with the same step.
+
+    If last time is provided, values up to and including it are dropped as well.
+    """
+
+    merged: list[MeasurementItem] = []
+
+    for measurement in sorted(measurements, key=lambda m: m.beg_time):
+        beg_time = measurement.beg_time
+        step_time = measurement.step_time or 0
+        value = measurement.value
+
+        if last_time is not None and beg_time <= last_time:
+            if step_time == 0:
+                continue
+            skip = (last_time - beg_time) // step_time + 1
+            beg_time += skip * step_time
+            value = value[skip:]
+
+        if not value:
+            continue
+
+        previous = merged[-1] if merged else None
+        if previous is not None and step_time and previous.step_time == step_time and previous.beg_time + len(previous.value) * step_time == beg_time:
+            previous.value.extend(value)
+        else:
+            merged.append(MeasurementItem.from_values(beg_time, measurement.step_time, array("d", value)))
+
+        last_time = beg_time + (len(value) - 1) * step_time
+
+    return merged
+
+
 class Device:
     """Device model representing a Vaillant boiler. Contains multiple modules."""
 
+    __slots__ = (
+        "id",
+        "type",
+        "station_name",
+        "firmware",
+        "wifi_status",
+        "dhw",
+        "dhw_max",
+        "dhw_min",
+        "setpoint_default_duration",
+        "outdoor_temperature",
+        "system_mode",
+        "setpoint_hwb",
+        "_modules",
+        "_raw_modules",
+    )
+
     def __init__(
         self,
         _id: str | None = None,
@@ -326,9 +807,14 @@ class Device:
         system_mode: str | None = None,
         setpoint_hwb: dict = {},
         modules: list[dict] = [],
+        lazy: bool = False,
         **kwargs,
     ) -> None:
-        """Create new device model."""
+        """
+        Create new device model.
+
+        If lazy is set, modules and their nested collections are built from the provided dicts on first access instead of right away.
+        """
 
         self.id = _id
         self.type = type
@@ -339,10 +825,90 @@ class Device:
         self.dhw_max = dhw_max
         self.dhw_min = dhw_min
         self.setpoint_default_duration = setpoint_default_duration
-        self.outdoor_temperature = OutdoorTemperature(**outdoor_temperature)
+        self.outdoor_temperature = OutdoorTemperature.from_dict(outdoor_temperature)
         self.system_mode = SystemMode(system_mode)
-        self.setpoint_hwb = Setpoint(**setpoint_hwb)
-        self.modules = [Module(**module) for module in modules]
+        self.setpoint_hwb = Setpoint.from_dict(setpoint_hwb)
+        if lazy:
+            self._modules = None
+            self._raw_modules = modules
+        else:
+            self._modules = [Module.from_dict(module) for module in modules]
+            self._raw_modules = None
+
+    @property
+    def modules(self) -> list[Module]:
+        if self._modules is None:
+            self._modules = [Module.from_dict(module, lazy=True) for module in self._raw_modules]
+            self._raw_modules = None
+
+        return self._modules
+
+    @modules.setter
+    def modules(self, modules: list[Module]) -> None:
+        self._modules = modules
+        self._raw_modules = None
+
+    @classmethod
+    def from_dict(cls, data: dict, lazy: bool = False) -> Device:
+        """Create new device model from a device of the API response."""
+
+        return cls(
+            data.get("_id"),
+            data.get("type", ""),
+            data.get("station_name", ""),
+            data.get("firmware", 0),
+            data.get("wifi_status", 0),
+            data.get("dhw"),
+            data.get("dhw_max"),
+            data.get("dhw_min"),
+            data.get("setpoint_default_duration", _SETPOINT_DEFAULT_DURATION_MINS),
+            data.get("outdoor_temperature", {}),
+            data.get("system_mode"),
+            data.get("setpoint_hwb", {}),
+            data.get("modules", []),
+            lazy,
+        )
+
+    @classmethod
+    def from_values(
+        cls,
+        id: str | None,
+        type: str,
+        station_name: str,
+        firmware: int,
+        wifi_status: int,
+        dhw: float | None,
+        dhw_max: float | None,
+        dhw_min: float | None,
+        setpoint_default_duration: int | None,
+        outdoor_temperature: OutdoorTemperature,
+        system_mode: SystemMode,
+        setpoint_hwb: Setpoint,
+        modules: list[Module],
+    ) -> Device:
+        """
+        Create new device model from already built attributes and modules (ie. by a typed decoder), without building them from dicts.
+
+        If setpoint default duration is None, the default duration is used.
+        """
+
+        device = cls.__new__(cls)
+        device.id = id
+        device.type = type
+        device.station_name = station_name
+        device.firmware = firmware
+        device.wifi_status = wifi_status
+        device.dhw = dhw
+        device.dhw_max = dhw_max
+        device.dhw_min = dhw_min
+        device.setpoint_default_duration = _SETPOINT_DEFAULT_DURATION_MINS if setpoint_default_duration is None else setpoint_default_duration
+        device.outdoor_temperature = outdoor_temperature
+        device.system_mode = system_mode
+        device.setpoint_hwb = setpoint_hwb
+        device._modules = modules
+        device._raw_modules = None
+
+        return device
 
     def __eq__(self, other: Device):
         if not isinstance(other, Device):
@@ -361,6 +927,20 @@ class Device:
 class Module:
     """Module model representing a Vaillant thermostat."""
 
+    __slots__ = (
+        "id",
+        "type",
+        "module_name",
+        "firmware",
+        "rf_status",
+        "battery_percent",
+        "setpoint_away",
+        "setpoint_manual",
+        "measured",
+        "_therm_program_list",
+        "_raw_therm_program_list",
+    )
+
     def __init__(
         self,
         _id: str | None = None,
@@ -373,9 +953,14 @@ class Module:
         setpoint_manual: dict = {},
         therm_program_list: list[dict] = [],
         measured: dict = {},
+        lazy: bool = False,
         **kwargs,
     ) -> None:
-        """Create new module model."""
+        """
+        Create new module model.
+
+        If lazy is set, programs and their timetables are built from the provided dicts on first access instead of right away.
+        """
 
         self.id = _id
         self.type = type
@@ -383,11 +968,90 @@ class Module:
         self.firmware = firmware
         self.rf_status = rf_status
         self.battery_percent = battery_percent
-        self.setpoint_away = Setpoint(**setpoint_away)
-        self.setpoint_manual = Setpoint(**setpoint_manual)
-        self.therm_program_list = [
-            Program(**program) for program in therm_program_list]
-        self.measured = Measured(**measured)
+        self.setpoint_away = Setpoint.from_dict(setpoint_away)
+        self.setpoint_manual = Setpoint.from_dict(setpoint_manual)
+        if lazy:
+            self._therm_program_list = None
+            self._raw_therm_program_list = therm_program_list
+        else:
+            self._therm_program_list = [
+                Program.from_dict(program) for program in therm_program_list]
+            self._raw_therm_program_list = None
+        self.measured = Measured.from_dict(measured)
+
+    @property
+    def therm_program_list(self) -> list[Program]:
+        if self._therm_program_list is None:
+            self._therm_program_list = [Program.from_dict(program, lazy=True) for program in self._raw_therm_program_list]
+            self._raw_therm_program_list = None
+
+        return self._therm_program_list
+
+    @therm_program_list.setter
+    def therm_program_list(self, therm_program_list: list[Program]) -> None:
+        self._therm_program_list = therm_program_list
+        self._raw_therm_program_list = None
+
+    @classmethod
+    def from_dict(cls, data: dict, lazy: bool = False) -> Module:
+        """Create new module model from a module of the API response."""
+
+        return cls(
+            data.get("_id"),
+            data.get("type", ""),
+            data.get("module_name", ""),
+            data.get("firmware", 0),
+            data.get("rf_status", 0),
+            data.get("battery_percent", 0),
+            data.get("setpoint_away", {}),
+            data.get("setpoint_manual", {}),
+            data.get("therm_program_list", []),
+            data.get("measured", {}),
+            lazy,
+        )
+
+    @classmethod
+    def from_values(
+        cls,
+        id: str | None,
+        type: str,
+        module_name: str,
+        firmware: int,
+        rf_status: int,
+        battery_percent: int,
+        setpoint_away: Setpoint,
+        setpoint_manual: Setpoint,
+        therm_program_list: list[Program],
+        measured: Measured,
+    ) -> Module:
+        """Create new module model from already built attributes and programs (ie. by a typed decoder), without building them from dicts."""
+
+        module = cls.__new__(cls)
+        module.id = id
+        module.type = type
+        module.module_name = module_name
+        module.firmware = firmware
+        module.rf_status = rf_status
+        module.battery_percent = battery_percent
+        module.setpoint_away = setpoint_away
+        module.setpoint_manual = setpoint_manual
+        module._therm_program_list = therm_program_list
+        module._raw_therm_program_list = None
+        module.measured = measured
+
+        return module
+
+    def schedule_fingerprint(self) -> tuple:
+        """
+        Returns a tuple which identifies the programs of the module, for detecting schedule changes.
+
+        Programs which are not built yet are fingerprinted from the API response, without building them, and equal programs have equal fingerprints either way.
+        """
+
+        if self._therm_program_list is None:
+            return tuple([_get_raw_program_fingerprint(program) for program in self._raw_therm_program_list])
+
+        return tuple([program.schedule_fingerprint() for program in self._therm_program_list])
 
     def __eq__(self, other: Module):
         if not isinstance(other, Module):
@@ -404,6 +1068,8 @@ class Module:
 class Program:
     """Program attribute representing a schedule for a thermostat."""
 
+    __slots__ = ("id", "_zones", "name", "selected", "_timetable", "_raw_timetable", "_offsets", "_time_slots", "_zones_by_id")
+
     def __init__(
         self,
         program_id: str | None = None,
@@ -411,34 +1077,206 @@ class Program:
         timetable: list[dict] = [],
         name: str = "",
         selected: bool = False,
+        lazy: bool = False,
         **kwargs,
     ) -> None:
-        """Create new program model."""
+        """
+        Create new program model.
+
+        If lazy is set, the timetable is built from the provided dicts on first access instead of right away.
+        """
 
         self.id = program_id
-        self.zones = [Zone(**zone) for zone in zones]
-        self.timetable = [TimeSlot(**time_slot) for time_slot in timetable]
+        self.zones = [Zone.from_dict(zone) for zone in zones]
+        if lazy:
+            self._timetable = None
+            self._raw_timetable = timetable
+        else:
+            self._timetable = [TimeSlot.from_dict(time_slot) for time_slot in timetable]
+            self._raw_timetable = None
         self.name = name
         self.selected = selected
 
+        self._offsets: list[int] | None = None
+        self._time_slots: list[TimeSlot] = []
+        self._zones_by_id: dict[int, Zone] = {}
+
+    @property
+    def zones(self) -> list[Zone]:
+        return self._zones
+
+    @zones.setter
+    def zones(self, zones: list[Zone]) -> None:
+        self._zones = zones
+        self._offsets = None
+
+    @property
+    def timetable(self) -> list[TimeSlot]:
+        if self._timetable is None:
+            self._timetable = [TimeSlot.from_dict(time_slot) for time_slot in self._raw_timetable]
+            self._raw_timetable = None
+
+        return self._timetable
+
+    @timetable.setter
+    def timetable(self, timetable: list[TimeSlot]) -> None:
+        self._timetable = timetable
+        self._raw_timetable = None
+        self._offsets = None
+
+    @classmethod
+    def from_dict(cls, data: dict, lazy: bool = False) -> Program:
+        """Create new program model from a program of the API response."""
+
+        return cls(
+            data.get("program_id"),
+            data.get("zones", []),
+            data.get("timetable", []),
+            data.get("name", ""),
+            data.get("selected", False),
+            lazy,
+        )
+
+    @classmethod
+    def from_values(cls, program_id: str | None, zones: list[Zone], timetable: list[TimeSlot], name: str, selected: bool) -> Program:
+        """Create new program model from already built zones and time slots (ie. by a typed decoder), without building them from dicts."""
+
+        program = cls.__new__(cls)
+        program.id = program_id
+        program._zones = zones
+        program._timetable = timetable
+        program._raw_timetable = None
+        program.name = name
+        program.selected = selected
+
+        program._offsets = None
+        program._time_slots = []
+        program._zones_by_id = {}
+
+        return program
+
     def get_active_zone(self) -> Zone | None:
         """Returns a currently active zone for a program."""
 
-        zone_id = 0
-        for time_slot in self.timetable:
-            if not time_slot.is_already_started:
-                break
-            zone_id = time_slot.id
+        return self.active_zone_at(now())
 
-        for zone in self.zones:
-            if zone.id == zone_id:
-                return zone
+    def active_zone_at(self, at: datetime) -> Zone | None:
+        """
+        Returns a zone which is active at the provided time.
+
+        Before the first time slot of the week, the last time slot of the previous week is still active. If the timetable is empty, the zone with id 0 is active.
+        """
+
+        self._compile()
+
+        if not self._time_slots:
+            return self._zones_by_id.get(0)
+
+        # Index -1 wraps around to the last time slot of the previous week.
+        i = bisect_right(self._offsets, _get_week_offset(at)) - 1
+        zone_id = self._time_slots[i].id
+
+        return self._zones_by_id.get(zone_id)
+
+    def next_transition_after(self, at: datetime) -> datetime | None:
+        """Returns a start time of the first time slot after the provided time, or None if the timetable is empty."""
+
+        self._compile()
+
+        if not self._offsets:
+            return None
+
+        week_begin = _get_week_begin(at)
+        i = bisect_right(self._offsets, _get_week_offset(at))
+        if i < len(self._offsets):
+            return week_begin + timedelta(minutes=self._offsets[i])
+
+        return week_begin + timedelta(days=7, minutes=self._offsets[0])
+
+    def slots_between(self, start: datetime, end: datetime) -> list[tuple[datetime, TimeSlot]]:
+        """Returns time slots starting in the [start, end) range, with their start times. The range can span multiple weeks."""
+
+        self._compile()
+
+        slots = []
+        if not self._offsets:
+            return slots
+
+        week_begin = _get_week_begin(start)
+        i = bisect_left(self._offsets, _get_week_offset(start))
+
+        while True:
+            if i == len(self._offsets):
+                week_begin += timedelta(days=7)
+                i = 0
+
+            slot_start = week_begin + timedelta(minutes=self._offsets[i])
+            if slot_start >= end:
+                return slots
+
+            if slot_start >= start:
+                slots.append((slot_start, self._time_slots[i]))
+            i += 1
+
+    def get_timeslots(self, start: datetime, end: datetime) -> list[tuple[datetime, TimeSlot]]:
+        """
+        Returns time slots in effect during the [start, end) range, with their start times. The range can span multiple weeks.
 
-        return None
+        The first time slot is the one active at start, with start as its start time. Before the first time slot of the week, this is the last time slot
+        of the previous week. If the timetable is empty, returns no time slots.
+        """
+
+        self._compile()
+
+        if start >= end or not self._time_slots:
+            return []
+
+        # Index -1 wraps around to the last time slot of the previous week.
+        i = bisect_right(self._offsets, _get_week_offset(start)) - 1
+        time_slot = self._time_slots[i]
+
+        return [(start, time_slot)] + [(slot_start, slot) for slot_start, slot in self.slots_between(start, end) if slot_start > start]
+
+    def schedule_fingerprint(self) -> tuple:
+        """Returns a tuple which identifies the zones and the timetable of the program. A timetable which is not built yet is fingerprinted without building it."""
+
+        if self._timetable is None:
+            timetable = _get_raw_timetable_fingerprint(self._raw_timetable)
+        else:
+            timetable = tuple([(time_slot.id, time_slot.m_offset) for time_slot in self._timetable])
+
+        return (
+            self.id,
+            self.selected,
+            tuple([(zone.id, zone.temp, zone.hw) for zone in self._zones]),
+            timetable,
+        )
+
+    def invalidate_schedule(self) -> None:
+        """
+        Drops the compiled timetable.
+
+        Assigning new zones or timetable drops it already. Should be called after the zones or timetable lists are modified in place (ie. a time slot is
+        appended or changed), since the compiled timetable can't detect such changes.
+        """
+
+        self._offsets = None
+
+    def _compile(self) -> None:
+        if self._offsets is not None:
+            return
+
+        self._time_slots = sorted(self.timetable, key=lambda time_slot: time_slot.m_offset)
+        self._zones_by_id = {}
+        for zone in self.zones:
+            self._zones_by_id.setdefault(zone.id, zone)
+        self._offsets = [time_slot.m_offset for time_slot in self._time_slots]
 
     def get_timeslots_for_today(self) -> list[TimeSlot]:
         """
         Returns a list of time slots which are defined for today.
+
+        For other ranges, or for evaluating many ranges, use get_timeslots, which works from the compiled timetable.
         """
 
         n = now()
@@ -460,9 +1298,36 @@ class Program:
         return time_slots
 
 
+def _get_raw_program_fingerprint(program: dict) -> tuple:
+    """Returns the schedule fingerprint of a program of the API response, using the same defaults as Program.from_dict."""
+
+    return (
+        program.get("program_id"),
+        program.get("selected", False),
+        tuple([(zone.get("id"), zone.get("temp", 0.0), zone.get("hw", False)) for zone in program.get("zones", [])]),
+        _get_raw_timetable_fingerprint(program.get("timetable", [])),
+    )
+
+
+def _get_raw_timetable_fingerprint(timetable: list[dict]) -> tuple:
+    return tuple([(time_slot.get("id"), time_slot.get("m_offset", 0)) for time_slot in timetable])
+
+
+def _get_week_begin(at: datetime) -> datetime:
+    return at.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=at.weekday())
+
+
+def _get_week_offset(at: datetime) -> int:
+    """Returns an offset of the provided time from the beginning of its week in minutes, the same way time slot offsets are defined."""
+
+    return at.weekday() * 1440 + at.hour * 60 + at.minute
+
+
 class Zone:
     """Zone attribute representing a zone profile which defines how thermostat behaves in a given time slot."""
 
+    __slots__ = ("id", "name", "temp", "hw")
+
     def __init__(
         self,
         id: int | None = None,
@@ -493,10 +1358,18 @@ class Zone:
             else:
                 self.name = ""
 
+    @classmethod
+    def from_dict(cls, data: dict) -> Zone:
+        """Create new zone attribute from a zone of the API response."""
+
+        return cls(data.get("id"), data.get("name", ""), data.get("temp", 0.0), data.get("hw", False))
+
 
 class TimeSlot:
     """TimeSlot attribute representing one slot of a timetable schedule."""
 
+    __slots__ = ("id", "m_offset")
+
     def __init__(
         self,
         id: int | None = None,
@@ -508,6 +1381,12 @@ class TimeSlot:
         self.id = id
         self.m_offset = m_offset
 
+    @classmethod
+    def from_dict(cls, data: dict) -> TimeSlot:
+        """Create new time slot attribute from a time slot of the API response."""
+
+        return cls(data.get("id"), data.get("m_offset", 0))
+
     @property
     def time(self) -> time:
         """Returns time instance representing the offset defined for this time slot."""
@@ -537,10 +1416,13 @@ class TimeSlot:
 class Setpoint:
     """Setpoint attribute representing a minor mode and its status."""
 
+    __slots__ = ("setpoint_activate", "setpoint_endtime", "setpoint_temp")
+
     def __init__(
         self,
         setpoint_activate: bool = False,
         setpoint_endtime: int | None = None,
+        setpoint_temp: float | None = None,
         **kwargs,
     ) -> None:
         """Create new setpoint attribute."""
@@ -550,9 +1432,18 @@ class Setpoint:
             self.setpoint_endtime = None
         else:
             self.setpoint_endtime = datetime.fromtimestamp(setpoint_endtime)
+        self.setpoint_temp = setpoint_temp
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Setpoint:
+        """Create new setpoint attribute from a setpoint of the API response."""
+
+        return cls(data.get("setpoint_activate", False), data.get("setpoint_endtime"), data.get("setpoint_temp"))
 
 
 class OutdoorTemperature:
+    __slots__ = ("te", "ti")
+
     def __init__(
         self,
         te: float | None = None,
@@ -567,10 +1458,18 @@ class OutdoorTemperature:
         else:
             self.ti = datetime.fromtimestamp(ti)
 
+    @classmethod
+    def from_dict(cls, data: dict) -> OutdoorTemperature:
+        """Create new outdoor temperature attribute from an outdoor temperature of the API response."""
+
+        return cls(data.get("te"), data.get("ti"))
+
 
 class Measured:
     """Measured attribute representing a thermostat measurement."""
 
+    __slots__ = ("temperature", "setpoint_temp", "est_setpoint_temp")
+
     def __init__(
         self,
         temperature: float | None = None,
@@ -584,9 +1483,23 @@ class Measured:
         self.setpoint_temp = setpoint_temp
         self.est_setpoint_temp = est_setpoint_temp
 
+    @classmethod
+    def from_dict(cls, data: dict) -> Measured:
+        """Create new measured attribute from a measurement of the API response."""
+
+        return cls(data.get("temperature"), data.get("setpoint_temp"), data.get("est_setpoint_temp"))
+
 
 class MeasurementItem:
-    """MeasurementItem attribute representing a one measurement of thermostat module."""
+    """
+    MeasurementItem attribute representing a one measurement of thermostat module.
+
+    Values are stored in a compact array of doubles, with missing values stored as NaN. Timestamps are not stored, but derived from the begin time and the step.
+    Items created from a memory view (ie. by view_between) keep the memory view as their values, which can't be resized and keeps the viewed array
+    from being resized while it exists. Values of an item are never changed in place by the library.
+    """
+
+    __slots__ = ("beg_time", "step_time", "value")
 
     def __init__(
         self,
@@ -599,7 +1512,29 @@ class MeasurementItem:
 
         self.beg_time = beg_time
         self.step_time = step_time
-        self.value = [value_item for inner_list in value for value_item in inner_list]
+        self.value = array("d", [
+            MISSING_VALUE if value_item is None else value_item
+            for inner_list in value
+            for value_item in inner_list
+        ])
+
+    @classmethod
+    def from_dict(cls, data: dict) -> MeasurementItem:
+        """Create new measurement item from a measurement of the API response."""
+
+        return cls(data.get("beg_time"), data.get("step_time"), data.get("value", []))
+
+    @classmethod
+    def from_values(cls, beg_time: int, step_time: int | None, values: array | memoryview | list[float]) -> MeasurementItem:
+        """Create new measurement item from flat values. Arrays and memory views of doubles are used as they are, without copying."""
+
+        item = cls(beg_time, step_time)
+        if isinstance(values, memoryview) and values.format == "d" or isinstance(values, array) and values.typecode == "d":
+            item.value = values
+        else:
+            item.value = array("d", values)
+
+        return item
 
     def __eq__(self, other: MeasurementItem):
         if not isinstance(other, MeasurementItem):
@@ -609,9 +1544,68 @@ class MeasurementItem:
             self.beg_time == other.beg_time
             and self.step_time == other.step_time
             and len(self.value) == len(other.value)
-            and all([False for i, j in zip(self.value, other.value) if i != j])
+            # Missing values are stored as NaN, which is never equal to itself.
+            and all([False for i, j in zip(self.value, other.value) if i != j and not (isnan(i) and isnan(j))])
         )
 
+    def __len__(self) -> int:
+        return len(self.value)
+
+    @property
+    def end_time(self) -> int | None:
+        """Returns a timestamp of the last value."""
+
+        if self.beg_time is None or not self.value:
+            return None
+
+        return self.beg_time + (len(self.value) - 1) * (self.step_time or 0)
+
+    @property
+    def timestamps(self) -> range:
+        """Returns timestamps of all the values, as a lazy range."""
+
+        if self.beg_time is None:
+            return range(0)
+        if not self.step_time:
+            return range(self.beg_time, self.beg_time + len(self.value))
+
+        return range(self.beg_time, self.beg_time + len(self.value) * self.step_time, self.step_time)
+
+    def between(self, start: datetime, end: datetime) -> MeasurementItem:
+        """Returns measurement item with a copy of the values in the [start, end) range."""
+
+        beg_time, start_index, end_index = self._get_range(start, end)
+
+        return MeasurementItem.from_values(beg_time, self.step_time, array("d", self.value[start_index:end_index]))
+
+    def view_between(self, start: datetime, end: datetime) -> MeasurementItem:
+        """
+        Returns measurement item with the values in the [start, end) range, as a read-only memory view of this item's values, without copying.
+
+        While the view exists, values of this item can't be resized (ie. appending raises BufferError), so the view should be released when no longer needed.
+        """
+
+        beg_time, start_index, end_index = self._get_range(start, end)
+
+        return MeasurementItem.from_values(beg_time, self.step_time, memoryview(self.value).toreadonly()[start_index:end_index])
+
+    def _get_range(self, start: datetime, end: datetime) -> tuple[int | None, int, int]:
+        timestamps = self.timestamps
+        start_index = bisect_left(timestamps, start.timestamp())
+        end_index = bisect_left(timestamps, end.timestamp())
+        end_index = max(start_index, end_index)
+
+        beg_time = timestamps[start_index] if start_index < len(timestamps) else self.beg_time
+
+        return beg_time, start_index, end_index
+
+    def to_numpy(self):
+        """Returns values as a NumPy array sharing the memory with this item. Requires NumPy to be installed."""
+
+        import numpy
+
+        return numpy.frombuffer(self.value, dtype=numpy.float64)
+
 
 class SystemMode(Enum):
     """SystemMode enumeration representing possible system modes of the thermostat."""
@@ -655,3 +1649,18 @@ class MeasurementScale(Enum):
     DAY = "1day"
     WEEK = "1week"
     MONTH = "1month"
+
+
+# Step of each measurement scale in seconds. Weeks and months are aligned to the calendar, so their steps are nominal.
+# The API doesn't document the step of the max scale, so the shortest step is assumed when splitting ranges into windows.
+MEASUREMENT_SCALE_SECONDS = {
+    MeasurementScale.MAX: 5 * 60,
+    MeasurementScale.FIVE_MINS: 5 * 60,
+    MeasurementScale.HALF_HOUR: 30 * 60,
+    MeasurementScale.HOUR: 60 * 60,
+    MeasurementScale.THREE_HOURS: 3 * 60 * 60,
+    MeasurementScale.SIX_HOURS: 6 * 60 * 60,
+    MeasurementScale.DAY: 24 * 60 * 60,
+    MeasurementScale.WEEK: 7 * 24 * 60 * 60,
+    MeasurementScale.MONTH: 28 * 24 * 60 * 60,
+}
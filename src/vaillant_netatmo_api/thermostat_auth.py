@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from urllib.parse import urlencode
 
 from httpx import Auth, Headers, Request, Response, codes
@@ -9,25 +9,29 @@ from .token import Token, TokenStore
 
 _TOKEN_PATH = "/oauth2/token"
 
+# Tokens which expire within this many seconds are refreshed before the request is made.
+DEFAULT_REFRESH_SKEW_SECONDS = 60.0
+
 
 class ThermostatAuth(Auth):
     """
     Thermostat client's Auth implementation of the httpx auth middleware.
     
-    For each request appends access token to the request body and handles refreshing access token after it expires.
+    For each request appends access token to the request body and handles refreshing access token before or after it expires.
     """
 
     requires_request_body = True
     requires_response_body = True
 
-    def __init__(self, token_store: TokenStore) -> None:
+    def __init__(self, token_store: TokenStore, refresh_skew: float = DEFAULT_REFRESH_SKEW_SECONDS) -> None:
         """
         Create auth instance.
 
-        Uses token store to get and update tokens.
+        Uses token store to get and update tokens. Tokens which expire within refresh skew seconds are refreshed before the request is made.
         """
 
         self._token_store = token_store
+        self._refresh_skew = refresh_skew
 
     def auth_flow(self, request: Request) -> Generator[Request, Response, None]:
         """
@@ -44,6 +48,46 @@ class ThermostatAuth(Auth):
 
             yield self._get_access_token_request(request)
 
+    async def async_auth_flow(self, request: Request) -> AsyncGenerator[Request, Response]:
+        """
+        Implementation of the async extension point in auth middleware.
+
+        Refreshes token ahead of its expiry and adds access token to request. If it fails, refreshes token and tries again.
+        Concurrent requests using the same token store share one refresh request.
+        """
+
+        await request.aread()
+
+        if self._should_refresh_token():
+            async with self._token_store.refresh_lock:
+                if self._should_refresh_token():
+                    refresh_response = yield self._get_refresh_token_request(request)
+                    await refresh_response.aread()
+                    self._process_refresh_response(refresh_response)
+
+        token = self._token_store.token
+        response = yield self._get_access_token_request(request)
+
+        if response.status_code == codes.UNAUTHORIZED or response.status_code == codes.FORBIDDEN:
+            async with self._token_store.refresh_lock:
+                # Another request could have already refreshed the token while this one was waiting.
+                if self._token_store.token is token:
+                    refresh_response = yield self._get_refresh_token_request(request)
+                    await refresh_response.aread()
+                    self._process_refresh_response(refresh_response)
+
+            yield self._get_access_token_request(request)
+
+    def _should_refresh_token(self) -> bool:
+        token = self._token_store.token
+
+        return (
+            token is not None
+            and token.refresh_token is not None
+            and token.expires_at is not None
+            and token.expires_within(self._refresh_skew)
+        )
+
     def _get_access_token_request(self, request: Request) -> Request:
         method = request.method
         url = request.url
@@ -55,6 +99,7 @@ class ThermostatAuth(Auth):
             url,
             content=content,
             headers=headers,
+            extensions=request.extensions,
         )
 
     def _get_refresh_token_request(self, request: Request) -> Request:
@@ -66,6 +111,7 @@ class ThermostatAuth(Auth):
             method,
             url,
             data=data,
+            extensions=request.extensions,
         )
     
     def _process_refresh_response(self, response: Response) -> None:
@@ -0,0 +1,69 @@
+import pytest
+
+from array import array
+from datetime import datetime
+from math import isnan
+
+from vaillant_netatmo_api.thermostat import MeasurementItem
+
+
+@pytest.mark.asyncio
+class TestMeasurementItem:
+    async def test_init__nested_values__stores_flat_array_of_doubles(self):
+        item = MeasurementItem(1000, 300, [[20], [20.5], [None]])
+
+        assert isinstance(item.value, array)
+        assert item.value.typecode == "d"
+        assert list(item.value[:2]) == [20.0, 20.5]
+        assert isnan(item.value[2])
+
+    async def test_eq__missing_values__returns_true(self):
+        assert MeasurementItem(1000, 300, [[20], [None]]) == MeasurementItem(1000, 300, [[20], [None]])
+
+    async def test_timestamps__values_with_step__returns_timestamp_per_value(self):
+        item = MeasurementItem(1000, 300, [[20], [21], [22]])
+
+        assert list(item.timestamps) == [1000, 1300, 1600]
+        assert item.end_time == 1600
+
+    async def test_between__time_range__returns_copy_of_values_in_range(self):
+        item = MeasurementItem(1000, 300, [[20], [21], [22], [23]])
+
+        sliced = item.between(datetime.fromtimestamp(1300), datetime.fromtimestamp(1900))
+        item.value.append(24)
+
+        assert sliced == MeasurementItem(1300, 300, [[21], [22]])
+        assert isinstance(sliced.value, array)
+
+    async def test_view_between__time_range__returns_read_only_view_of_values_in_range(self):
+        item = MeasurementItem(1000, 300, [[20], [21], [22], [23]])
+
+        sliced = item.view_between(datetime.fromtimestamp(1300), datetime.fromtimestamp(1900))
+
+        assert sliced == MeasurementItem(1300, 300, [[21], [22]])
+        assert sliced.value.obj is item.value
+        assert sliced.value.readonly
+
+    async def test_between__range_outside_values__returns_empty_item(self):
+        item = MeasurementItem(1000, 300, [[20], [21]])
+
+        sliced = item.between(datetime.fromtimestamp(5000), datetime.fromtimestamp(6000))
+
+        assert len(sliced) == 0
+
+    async def test_from_values__array_of_doubles__uses_array_without_copying(self):
+        values = array("d", [1.0, 2.0])
+
+        item = MeasurementItem.from_values(1000, 300, values)
+
+        assert item.value is values
+
+    async def test_to_numpy__values__returns_numpy_array_sharing_memory(self):
+        numpy = pytest.importorskip("numpy")
+
+        item = MeasurementItem(1000, 300, [[20], [21]])
+
+        values = item.to_numpy()
+
+        assert isinstance(values, numpy.ndarray)
+        assert values.tolist() == [20.0, 21.0]
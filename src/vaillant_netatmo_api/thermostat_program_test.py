@@ -4,7 +4,7 @@ from datetime import datetime
 
 from pytest_mock import MockerFixture
 
-from vaillant_netatmo_api.thermostat import Program
+from vaillant_netatmo_api.thermostat import Program, Zone
 
 @pytest.mark.parametrize(
     "current_time,expected_active_zone_id", 
@@ -178,3 +178,119 @@ class TestProgramForTimeslots:
         assert time_slots[1].m_offset == 1500
         assert time_slots[2].id == 2
         assert time_slots[2].m_offset == 1560
+
+@pytest.mark.asyncio
+class TestProgramForCompiledTimetable:
+    async def test_active_zone_at__time_before_first_slot__returns_zone_of_last_slot_of_previous_week(self):
+        program = Program(
+            zones=[{"id": 0}, {"id": 1}, {"id": 2}],
+            timetable=[{"id": 1, "m_offset": 60}, {"id": 2, "m_offset": 10020}],
+        )
+
+        assert program.active_zone_at(datetime(2021, 11, 22, 0, 59)).id == 2
+        assert program.active_zone_at(datetime(2021, 11, 22, 1, 0)).id == 1
+        assert program.active_zone_at(datetime(2021, 11, 28, 23, 59)).id == 2
+
+    async def test_active_zone_at__empty_timetable__returns_zone_0(self):
+        program = Program(zones=[{"id": 0}, {"id": 1}])
+
+        assert program.active_zone_at(datetime(2021, 11, 22, 12, 0)).id == 0
+
+    async def test_active_zone_at__zones_assigned__returns_assigned_zone(self):
+        program = Program(
+            zones=[{"id": 1, "temp": 17}],
+            timetable=[{"id": 1, "m_offset": 0}],
+        )
+        assert program.active_zone_at(datetime(2021, 11, 22, 12, 0)).temp == 17
+
+        program.zones = [Zone(1, temp=19)]
+
+        assert program.active_zone_at(datetime(2021, 11, 22, 12, 0)).temp == 19
+
+    async def test_next_transition_after__time_after_last_slot__returns_first_slot_of_next_week(self):
+        program = Program(
+            timetable=[{"id": 1, "m_offset": 60}, {"id": 0, "m_offset": 1500}],
+        )
+
+        assert program.next_transition_after(datetime(2021, 11, 22, 0, 30)) == datetime(2021, 11, 22, 1, 0)
+        assert program.next_transition_after(datetime(2021, 11, 22, 1, 0)) == datetime(2021, 11, 23, 1, 0)
+        assert program.next_transition_after(datetime(2021, 11, 25, 12, 0)) == datetime(2021, 11, 29, 1, 0)
+        assert Program().next_transition_after(datetime(2021, 11, 22)) is None
+
+    async def test_slots_between__range_across_week_boundary__returns_slots_of_both_weeks(self):
+        program = Program(
+            timetable=[{"id": 1, "m_offset": 60}, {"id": 0, "m_offset": 10020}],
+        )
+
+        slots = program.slots_between(datetime(2021, 11, 28, 23, 0), datetime(2021, 11, 29, 2, 0))
+
+        assert [(start, slot.id) for start, slot in slots] == [
+            (datetime(2021, 11, 28, 23, 0), 0),
+            (datetime(2021, 11, 29, 1, 0), 1),
+        ]
+
+    async def test_slots_between__start_after_slot_start_in_same_minute__skips_slot(self):
+        program = Program(
+            timetable=[{"id": 1, "m_offset": 60}, {"id": 0, "m_offset": 120}],
+        )
+
+        slots = program.slots_between(datetime(2021, 11, 22, 1, 0, 30), datetime(2021, 11, 22, 3, 0))
+
+        assert [(start, slot.id) for start, slot in slots] == [(datetime(2021, 11, 22, 2, 0), 0)]
+
+    async def test_invalidate_schedule__modified_timetable__returns_zone_of_modified_timetable(self):
+        program = Program(
+            zones=[{"id": 0}, {"id": 1}],
+            timetable=[{"id": 1, "m_offset": 0}],
+        )
+        assert program.active_zone_at(datetime(2021, 11, 22, 12, 0)).id == 1
+
+        program.timetable[0].id = 0
+        program.invalidate_schedule()
+
+        assert program.active_zone_at(datetime(2021, 11, 22, 12, 0)).id == 0
+
+    async def test_get_timeslots__range_across_week_boundary__returns_active_slot_and_following_slots(self):
+        program = Program(
+            timetable=[{"id": 1, "m_offset": 60}, {"id": 0, "m_offset": 10020}],
+        )
+
+        slots = program.get_timeslots(datetime(2021, 11, 28, 12, 0, 30), datetime(2021, 11, 30, 0, 0))
+
+        assert [(start, slot.id) for start, slot in slots] == [
+            (datetime(2021, 11, 28, 12, 0, 30), 1),
+            (datetime(2021, 11, 28, 23, 0), 0),
+            (datetime(2021, 11, 29, 1, 0), 1),
+        ]
+
+    async def test_get_timeslots__start_before_first_slot__returns_last_slot_of_previous_week(self):
+        program = Program(
+            timetable=[{"id": 0, "m_offset": 60}, {"id": 1, "m_offset": 10020}],
+        )
+
+        slots = program.get_timeslots(datetime(2021, 11, 22, 0, 0), datetime(2021, 11, 22, 2, 0))
+
+        assert [(start, slot.id) for start, slot in slots] == [
+            (datetime(2021, 11, 22, 0, 0), 1),
+            (datetime(2021, 11, 22, 1, 0), 0),
+        ]
+        assert program.get_timeslots(datetime(2021, 11, 22, 2, 0), datetime(2021, 11, 22, 2, 0)) == []
+        assert Program().get_timeslots(datetime(2021, 11, 22, 0, 0), datetime(2021, 11, 22, 2, 0)) == []
+
+    async def test_get_timeslots__ranges_from_before_and_after_week_boundary__agree_on_overlap(self):
+        program = Program(
+            timetable=[{"id": 0, "m_offset": 60}, {"id": 1, "m_offset": 10020}],
+        )
+
+        from_sunday = program.get_timeslots(datetime(2021, 11, 28, 22, 0), datetime(2021, 11, 29, 2, 0))
+        from_monday = program.get_timeslots(datetime(2021, 11, 29, 0, 0), datetime(2021, 11, 29, 2, 0))
+
+        assert [(start, slot.id) for start, slot in from_sunday] == [
+            (datetime(2021, 11, 28, 22, 0), 0),
+            (datetime(2021, 11, 28, 23, 0), 1),
+            (datetime(2021, 11, 29, 1, 0), 0),
+        ]
+        assert [(start, slot.id) for start, slot in from_monday] == [
+            (datetime(2021, 11, 29, 0, 0), 1),
+            (datetime(2021, 11, 29, 1, 0), 0),
+        ]
@@ -1,14 +1,21 @@
+import asyncio
+import json
+
 import httpx
 import pytest
 
 from datetime import datetime, timedelta
+from time import time
 
 from pytest_mock import MockerFixture
 from respx import MockRouter
 
-from vaillant_netatmo_api.errors import RequestClientException, UnsuportedArgumentsException
-from vaillant_netatmo_api.thermostat import Device, MeasurementItem, MeasurementScale, MeasurementType, SetpointMode, SystemMode, TimeSlot, Zone, thermostat_client
-from vaillant_netatmo_api.token import Token
+from vaillant_netatmo_api.cache import ResponseCache
+from vaillant_netatmo_api.errors import DeadlineExceededException, NonOkResponseException, RequestBackoffException, RequestClientException, RequestServerException, ResponseDecodeException, UnsuportedArgumentsException
+from vaillant_netatmo_api.rate_limit import RateLimit, RateLimiter
+from vaillant_netatmo_api.retry import RetryPolicy
+from vaillant_netatmo_api.thermostat import Device, MeasurementItem, MeasurementScale, MeasurementType, Module, Program, SetpointMode, SystemMode, ThermostatClient, TimeSlot, Zone, thermostat_client
+from vaillant_netatmo_api.token import Token, TokenStore
 
 token = Token({
     "access_token": "12345",
@@ -207,6 +214,257 @@ class TestThermostat:
             for x in zip(devices, expected_devices):
                 assert x[0] == Device(**x[1])
 
+    async def test_async_get_thermostats_data__concurrent_calls_with_single_flight__sends_one_request(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json=get_thermostats_data_response)
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), single_flight=True)
+
+            results = await asyncio.gather(*[client.async_get_thermostats_data() for _ in range(5)])
+
+            assert respx_mock.calls.call_count == 1
+            assert all(devices is results[0] for devices in results)
+
+    async def test_async_get_thermostats_data__joining_calls_with_single_flight__use_own_deadlines(self, respx_mock: MockRouter):
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json=get_thermostats_data_response)
+
+        route = respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).mock(side_effect=respond)
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), single_flight=True)
+
+            results = await asyncio.gather(
+                client.async_get_thermostats_data(deadline=0.05),
+                client.async_get_thermostats_data(),
+                return_exceptions=True,
+            )
+
+            assert isinstance(results[0], DeadlineExceededException)
+            assert results[1] == [Device(**device) for device in get_thermostats_data_response["body"]["devices"]]
+            assert route.call_count == 1
+
+    async def test_async_get_thermostats_data__concurrent_calls_without_single_flight__sends_each_request(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json=get_thermostats_data_response)
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token))
+
+            await asyncio.gather(*[client.async_get_thermostats_data() for _ in range(5)])
+
+            assert respx_mock.calls.call_count == 5
+
+    async def test_async_get_thermostats_data__cached_response__sends_one_request(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json=get_thermostats_data_response)
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), cache=ResponseCache())
+
+            first = await client.async_get_thermostats_data()
+            second = await client.async_get_thermostats_data()
+
+            assert respx_mock.calls.call_count == 1
+            assert first is second
+
+    async def test_async_get_thermostats_data__cached_response_after_write__sends_new_request(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json=get_thermostats_data_response)
+        respx_mock.post("https://api.netatmo.com/api/setsystemmode", data={**set_system_mode_request, "device_id": "id"}).respond(200, json=set_system_mode_response)
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), cache=ResponseCache())
+
+            await client.async_get_thermostats_data()
+            await client.async_set_system_mode("id", set_system_mode_request["module_id"], SystemMode.SUMMER)
+            await client.async_get_thermostats_data()
+
+            assert respx_mock.calls.call_count == 3
+
+    async def test_async_get_thermostats_data__expiring_token__refreshes_token_before_request(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/oauth2/token", data=refresh_token_request).respond(200, json=refresh_token_response)
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_refreshed_request).respond(200, json=get_thermostats_data_response)
+
+        expiring_token = Token({
+            "access_token": "12345",
+            "refresh_token": "abcde",
+            "expires_at": int(time()) + 10,
+        })
+
+        async with thermostat_client(refresh_token_request["client_id"], refresh_token_request["client_secret"], expiring_token, None) as client:
+            await asyncio.gather(*[client.async_get_thermostats_data() for _ in range(5)])
+
+            assert respx_mock.routes[0].call_count == 1
+            assert respx_mock.routes[1].call_count == 5
+
+    async def test_async_get_thermostats_data__concurrent_unauthorized_errors__refreshes_token_once(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(401)
+        respx_mock.post("https://api.netatmo.com/oauth2/token", data=refresh_token_request).respond(200, json=refresh_token_response)
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_refreshed_request).respond(200, json=get_thermostats_data_response)
+
+        async with thermostat_client(refresh_token_request["client_id"], refresh_token_request["client_secret"], token, None) as client:
+            await asyncio.gather(*[client.async_get_thermostats_data() for _ in range(5)])
+
+            assert respx_mock.routes[1].call_count == 1
+
+    async def test_async_get_thermostats_data__rate_limiter__consumes_budget(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json=get_thermostats_data_response)
+
+        rate_limiter = RateLimiter([RateLimit(10, 3600)])
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), rate_limiter=rate_limiter)
+
+            await client.async_get_thermostats_data()
+            await client.async_get_thermostats_data()
+
+            assert rate_limiter.remaining == 8
+
+    async def test_async_get_thermostats_data__too_many_requests__drains_rate_limiter(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(429)
+
+        rate_limiter = RateLimiter([RateLimit(10, 3600)])
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), rate_limiter=rate_limiter)
+
+            with pytest.raises(RequestBackoffException):
+                await client.async_get_thermostats_data()
+
+            assert rate_limiter.remaining == 0
+
+    async def test_async_get_thermostats_data__server_errors_with_deadline__stops_retrying_after_deadline(self, respx_mock: MockRouter, mocker: MockerFixture):
+        clock = [0.0]
+        mocker.patch("vaillant_netatmo_api.base.monotonic", side_effect=lambda: clock[0])
+        mocker.patch("vaillant_netatmo_api.retry.monotonic", side_effect=lambda: clock[0])
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            clock[0] += 1
+            return httpx.Response(500)
+
+        route = respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).mock(side_effect=respond)
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), retry_policy=RetryPolicy(backoff_multiplier=0))
+
+            with pytest.raises(RequestServerException):
+                await client.async_get_thermostats_data(deadline=2.5)
+
+            assert route.call_count == 3
+
+    async def test_async_get_thermostats_data__response_slower_than_deadline__raises_error(self, respx_mock: MockRouter):
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(1)
+            return httpx.Response(200, json=get_thermostats_data_response)
+
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).mock(side_effect=respond)
+
+        async with thermostat_client("", "", token, None) as client:
+            with pytest.raises(DeadlineExceededException):
+                await client.async_get_thermostats_data(deadline=0.1)
+
+    async def test_async_get_thermostats_data__timeout_for_path__uses_configured_timeout(self, respx_mock: MockRouter):
+        route = respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json=get_thermostats_data_response)
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), timeouts={"api/getthermostatsdata": httpx.Timeout(5.0, connect=1.0)})
+
+            await client.async_get_thermostats_data()
+
+            assert route.calls.last.request.extensions["timeout"] == {"connect": 1.0, "read": 5.0, "write": 5.0, "pool": 5.0}
+
+    async def test_async_get_thermostats_data__custom_json_decoder__decodes_response_bytes(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json=get_thermostats_data_response)
+        decoded = []
+
+        def decoder(content: bytes) -> dict:
+            decoded.append(content)
+            return json.loads(content)
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), json_decoder=decoder)
+
+            devices = await client.async_get_thermostats_data()
+
+            assert len(decoded) == 1
+            assert isinstance(decoded[0], bytes)
+            assert devices[0] == Device(**get_thermostats_data_response["body"]["devices"][0])
+
+    async def test_async_get_thermostats_data__response_not_json__raises_error(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, content=b"<html></html>")
+
+        async with thermostat_client("", "", token, None) as client:
+            with pytest.raises(ResponseDecodeException):
+                await client.async_get_thermostats_data()
+
+    async def test_async_get_thermostats_data__typed_decoding__returns_same_devices(self, respx_mock: MockRouter):
+        pytest.importorskip("msgspec")
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json=get_thermostats_data_response)
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), typed_decoding=True)
+
+            devices = await client.async_get_thermostats_data()
+
+            assert devices == [Device(**device) for device in get_thermostats_data_response["body"]["devices"]]
+            program = devices[0].modules[0].therm_program_list[0]
+            assert program.zones[0].temp == 20 and program.zones[0].hw
+            assert program.timetable[0].m_offset == 0
+            assert devices[0].modules[0].setpoint_away.setpoint_endtime == datetime.fromtimestamp(1642056298)
+
+    async def test_async_get_thermostats_data__typed_decoding_of_unexpected_types__raises_error(self, respx_mock: MockRouter):
+        pytest.importorskip("msgspec")
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json={
+            "status": "ok",
+            "body": {"devices": [{"_id": "id", "modules": "not a list"}]},
+        })
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), typed_decoding=True)
+
+            with pytest.raises(ResponseDecodeException):
+                await client.async_get_thermostats_data()
+
+    async def test_async_get_thermostats_data__deadline_shorter_than_timeout__clamps_timeout(self, respx_mock: MockRouter):
+        route = respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json=get_thermostats_data_response)
+
+        async with thermostat_client("", "", token, None) as client:
+            await client.async_get_thermostats_data(deadline=2)
+
+            assert all(0 < t <= 2 for t in route.calls.last.request.extensions["timeout"].values())
+
+    async def test_async_get_thermostats_data_raw__valid_request_params__returns_response(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json=get_thermostats_data_response)
+
+        async with thermostat_client("", "", token, None) as client:
+            body = await client.async_get_thermostats_data_raw()
+            content = await client.async_get_thermostats_data_raw(as_bytes=True)
+
+            assert body == get_thermostats_data_response
+            assert isinstance(content, bytes)
+            assert json.loads(content) == get_thermostats_data_response
+
+    async def test_async_get_thermostats_data_raw__not_ok_response__raises_error(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json={"status": "error"})
+
+        async with thermostat_client("", "", token, None) as client:
+            with pytest.raises(NonOkResponseException):
+                await client.async_get_thermostats_data_raw(as_bytes=True)
+
+    async def test_async_get_measure_raw__valid_request_params__returns_response(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data=get_measure_request).respond(200, json=get_measure_response)
+
+        async with thermostat_client("", "", token, None) as client:
+            content = await client.async_get_measure_raw(
+                get_measure_request["device_id"],
+                get_measure_request["module_id"],
+                MeasurementType.TEMPERATURE,
+                MeasurementScale.MAX,
+                datetime.fromtimestamp(get_measure_request["date_begin"]),
+                as_bytes=True,
+            )
+
+            assert json.loads(content) == get_measure_response
+
     async def test_async_get_measure__invalid_request_params__raises_error(self, respx_mock: MockRouter):
         respx_mock.post("https://api.netatmo.com/api/getmeasure", data=get_measure_request).respond(400)
 
@@ -238,6 +496,183 @@ class TestThermostat:
             for x in zip(measurement_items, expected_measurement_items):
                 assert x[0] == MeasurementItem(**x[1])
 
+    async def test_async_get_measure__typed_decoding__returns_same_measurement_items(self, respx_mock: MockRouter):
+        pytest.importorskip("msgspec")
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data=get_measure_request).respond(200, json=get_measure_response)
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), typed_decoding=True)
+
+            measurement_items = await client.async_get_measure(
+                get_measure_request["device_id"],
+                get_measure_request["module_id"],
+                MeasurementType.TEMPERATURE,
+                MeasurementScale.MAX,
+                datetime.fromtimestamp(get_measure_request["date_begin"]),
+            )
+
+            assert measurement_items == [MeasurementItem(**measurement) for measurement in get_measure_response["body"]]
+
+    async def test_async_get_measure__range_longer_than_one_request__returns_stitched_measurement_items(self, respx_mock: MockRouter):
+        date_begin = get_measure_request["date_begin"]
+        date_end = date_begin + 300 * 1024 + 900
+
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data={**get_measure_request, "scale": "5min", "date_end": date_begin + 300 * 1024 - 1}).respond(200, json={
+            "status": "ok",
+            "body": [{"beg_time": date_begin + 300 * 1022, "step_time": 300, "value": [[1], [2]]}],
+        })
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data={**get_measure_request, "scale": "5min", "date_begin": date_begin + 300 * 1024, "date_end": date_end}).respond(200, json={
+            "status": "ok",
+            "body": [{"beg_time": date_begin + 300 * 1023, "step_time": 300, "value": [[2], [3], [4]]}],
+        })
+
+        async with thermostat_client("", "", token, None) as client:
+            measurement_items = await client.async_get_measure(
+                get_measure_request["device_id"],
+                get_measure_request["module_id"],
+                MeasurementType.TEMPERATURE,
+                MeasurementScale.FIVE_MINS,
+                datetime.fromtimestamp(date_begin),
+                datetime.fromtimestamp(date_end),
+            )
+
+            assert respx_mock.calls.call_count == 2
+            assert measurement_items == [MeasurementItem(date_begin + 300 * 1022, 300, [[1], [2], [3], [4]])]
+
+    async def test_async_get_measure__windows_slower_than_deadline__raises_error(self, respx_mock: MockRouter):
+        date_begin = get_measure_request["date_begin"]
+        date_end = date_begin + 300 * 1024 * 8 - 1
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json={"status": "ok", "body": []})
+
+        route = respx_mock.post("https://api.netatmo.com/api/getmeasure").mock(side_effect=respond)
+
+        async with thermostat_client("", "", token, None) as client:
+            started = time()
+            with pytest.raises(DeadlineExceededException):
+                await client.async_get_measure(
+                    get_measure_request["device_id"],
+                    get_measure_request["module_id"],
+                    MeasurementType.TEMPERATURE,
+                    MeasurementScale.FIVE_MINS,
+                    datetime.fromtimestamp(date_begin),
+                    datetime.fromtimestamp(date_end),
+                    deadline=0.3,
+                    max_concurrency=1,
+                )
+
+            assert time() - started < 1
+            assert route.call_count < 8
+
+    async def test_async_get_measures__windows_slower_than_deadline__raises_error(self, respx_mock: MockRouter):
+        date_begin = get_measure_request["date_begin"]
+        date_end = date_begin + 300 * 1024 * 8 - 1
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json={"status": "ok", "body": []})
+
+        respx_mock.post("https://api.netatmo.com/api/getmeasure").mock(side_effect=respond)
+
+        async with thermostat_client("", "", token, None) as client:
+            with pytest.raises(DeadlineExceededException):
+                await client.async_get_measures(
+                    get_measure_request["device_id"],
+                    get_measure_request["module_id"],
+                    [MeasurementType.TEMPERATURE, MeasurementType.SETPOINT_TEMPERATURE],
+                    MeasurementScale.FIVE_MINS,
+                    datetime.fromtimestamp(date_begin),
+                    datetime.fromtimestamp(date_end),
+                    deadline=0.3,
+                    max_concurrency=1,
+                )
+
+    async def test_async_get_measure__stitched_windows_with_gap__returns_separate_measurement_items(self, respx_mock: MockRouter):
+        date_begin = get_measure_request["date_begin"]
+        date_end = date_begin + 300 * 1024 + 900
+
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data={**get_measure_request, "scale": "5min", "date_end": date_begin + 300 * 1024 - 1}).respond(200, json={
+            "status": "ok",
+            "body": [{"beg_time": date_begin, "step_time": 300, "value": [[1], [2]]}],
+        })
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data={**get_measure_request, "scale": "5min", "date_begin": date_begin + 300 * 1024, "date_end": date_end}).respond(200, json={
+            "status": "ok",
+            "body": [{"beg_time": date_begin + 300 * 1024, "step_time": 300, "value": [[3]]}],
+        })
+
+        async with thermostat_client("", "", token, None) as client:
+            measurement_items = await client.async_get_measure(
+                get_measure_request["device_id"],
+                get_measure_request["module_id"],
+                MeasurementType.TEMPERATURE,
+                MeasurementScale.FIVE_MINS,
+                datetime.fromtimestamp(date_begin),
+                datetime.fromtimestamp(date_end),
+            )
+
+            assert measurement_items == [
+                MeasurementItem(date_begin, 300, [[1], [2]]),
+                MeasurementItem(date_begin + 300 * 1024, 300, [[3]]),
+            ]
+
+    async def test_async_iter_measure__range_longer_than_one_request__yields_chunk_per_window_without_overlap(self, respx_mock: MockRouter):
+        date_begin = get_measure_request["date_begin"]
+        date_end = date_begin + 300 * 1024 + 900
+
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data={**get_measure_request, "scale": "5min", "date_end": date_begin + 300 * 1024 - 1}).respond(200, json={
+            "status": "ok",
+            "body": [{"beg_time": date_begin + 300 * 1022, "step_time": 300, "value": [[1], [2]]}],
+        })
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data={**get_measure_request, "scale": "5min", "date_begin": date_begin + 300 * 1024, "date_end": date_end}).respond(200, json={
+            "status": "ok",
+            "body": [{"beg_time": date_begin + 300 * 1023, "step_time": 300, "value": [[2], [3], [4]]}],
+        })
+
+        async with thermostat_client("", "", token, None) as client:
+            chunks = [
+                chunk
+                async for chunk in client.async_iter_measure(
+                    get_measure_request["device_id"],
+                    get_measure_request["module_id"],
+                    MeasurementType.TEMPERATURE,
+                    MeasurementScale.FIVE_MINS,
+                    datetime.fromtimestamp(date_begin),
+                    datetime.fromtimestamp(date_end),
+                    read_ahead=1,
+                )
+            ]
+
+            assert chunks == [
+                [MeasurementItem(date_begin + 300 * 1022, 300, [[1], [2]])],
+                [MeasurementItem(date_begin + 300 * 1024, 300, [[3], [4]])],
+            ]
+
+    async def test_async_get_measures__multiple_types__returns_column_per_type_from_one_request(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getmeasure", data={**get_measure_request, "type": "temperature,sp_temperature,sum_boiler_on"}).respond(200, json={
+            "status": "ok",
+            "body": [
+                {"beg_time": 1642252768, "step_time": 600, "value": [[20, 21, 0], [20.1, 21, None]]},
+            ],
+        })
+
+        async with thermostat_client("", "", token, None) as client:
+            measurements = await client.async_get_measures(
+                get_measure_request["device_id"],
+                get_measure_request["module_id"],
+                [MeasurementType.TEMPERATURE, MeasurementType.SETPOINT_TEMPERATURE, MeasurementType.SUM_BOILER_ON],
+                MeasurementScale.MAX,
+                datetime.fromtimestamp(get_measure_request["date_begin"]),
+            )
+
+            assert respx_mock.calls.call_count == 1
+            assert measurements == {
+                MeasurementType.TEMPERATURE: [MeasurementItem(1642252768, 600, [[20], [20.1]])],
+                MeasurementType.SETPOINT_TEMPERATURE: [MeasurementItem(1642252768, 600, [[21], [21]])],
+                MeasurementType.SUM_BOILER_ON: [MeasurementItem(1642252768, 600, [[0], [None]])],
+            }
+
     async def test_async_set_system_mode__invalid_request_params__raises_error(self, respx_mock: MockRouter):
         respx_mock.post("https://api.netatmo.com/api/setsystemmode", data=set_system_mode_request).respond(400)
 
@@ -742,3 +1177,78 @@ class TestThermostat:
                 sync_schedule_request["module_id"],
                 sync_schedule_request["schedule_id"],
             )
+
+
+@pytest.mark.asyncio
+class TestThermostatModels:
+    async def test_from_dict__device_from_response__equals_device_from_kwargs(self):
+        device_data = get_thermostats_data_response["body"]["devices"][0]
+
+        device = Device.from_dict(device_data)
+        expected = Device(**device_data)
+
+        assert device == expected
+        assert device.system_mode == SystemMode.SUMMER
+        assert device.outdoor_temperature.ti == expected.outdoor_temperature.ti
+        assert device.modules[0] == expected.modules[0]
+        assert device.modules[0].measured.est_setpoint_temp == 27
+        assert device.modules[0].setpoint_away.setpoint_endtime == expected.modules[0].setpoint_away.setpoint_endtime
+        assert device.modules[0].therm_program_list[0].zones[0].name == "Comfort"
+        assert device.modules[0].therm_program_list[0].timetable[0].m_offset == 0
+
+    async def test_from_values__built_attributes__equals_device_from_dict(self):
+        device_data = get_thermostats_data_response["body"]["devices"][0]
+        expected = Device.from_dict(device_data)
+        module = expected.modules[0]
+        program = module.therm_program_list[0]
+
+        device = Device.from_values(
+            expected.id, expected.type, expected.station_name, expected.firmware, expected.wifi_status, expected.dhw, expected.dhw_max,
+            expected.dhw_min, None, expected.outdoor_temperature, expected.system_mode, expected.setpoint_hwb,
+            [Module.from_values(
+                module.id, module.type, module.module_name, module.firmware, module.rf_status, module.battery_percent, module.setpoint_away,
+                module.setpoint_manual, [Program.from_values(program.id, program.zones, program.timetable, program.name, program.selected)], module.measured,
+            )],
+        )
+
+        assert device == expected
+        assert device.setpoint_default_duration == 120
+        assert device.modules[0].therm_program_list[0].active_zone_at(datetime(2021, 11, 22, 12, 0)).id == 0
+
+    async def test_schedule_fingerprint__lazy_module__equals_fingerprint_of_built_module_without_building_programs(self):
+        module_data = get_thermostats_data_response["body"]["devices"][0]["modules"][0]
+
+        module = Module.from_dict(module_data, lazy=True)
+
+        assert module.schedule_fingerprint() == Module.from_dict(module_data).schedule_fingerprint()
+        assert module._therm_program_list is None
+
+    async def test_from_dict__device_from_response__has_no_instance_dict(self):
+        device = Device.from_dict(get_thermostats_data_response["body"]["devices"][0])
+
+        assert not hasattr(device, "__dict__")
+        assert not hasattr(device.modules[0], "__dict__")
+        assert not hasattr(device.modules[0].therm_program_list[0], "__dict__")
+        assert not hasattr(MeasurementItem(), "__dict__")
+
+    async def test_from_dict__lazy_device__builds_nested_models_on_first_access(self):
+        device_data = get_thermostats_data_response["body"]["devices"][0]
+
+        device = Device.from_dict(device_data, lazy=True)
+
+        assert device._modules is None
+        assert device == Device(**device_data)
+        assert device.modules[0]._therm_program_list is None
+        assert device.modules[0].therm_program_list[0]._timetable is None
+        assert device.modules[0].therm_program_list[0].timetable[0].m_offset == 0
+        assert device.modules[0].measured.temperature == 25
+
+    async def test_async_get_thermostats_data__lazy_client__returns_same_devices(self, respx_mock: MockRouter):
+        respx_mock.post("https://api.netatmo.com/api/getthermostatsdata", data=get_thermostats_data_request).respond(200, json=get_thermostats_data_response)
+
+        async with httpx.AsyncClient() as c:
+            client = ThermostatClient(c, TokenStore("", "", token), lazy=True)
+
+            devices = await client.async_get_thermostats_data()
+
+            assert devices == [Device(**device) for device in get_thermostats_data_response["body"]["devices"]]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 
 from time import time
@@ -20,6 +21,7 @@ class TokenStore:
         self._client_secret = client_secret
         self._token = token
         self._on_token_update = on_token_update
+        self._refresh_lock = None
 
     @property
     def token(self) -> Token | None:
@@ -32,6 +34,15 @@ class TokenStore:
         if self._on_token_update is not None:
             self._on_token_update(self._token)
     
+    @property
+    def refresh_lock(self) -> asyncio.Lock:
+        """Returns a lock which is shared by all the requests using this token store, so only one of them refreshes the token at a time."""
+
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+
+        return self._refresh_lock
+
     @property
     def access_token_request(self) -> dict:
         return {
@@ -82,12 +93,21 @@ class Token:
     def refresh_token(self) -> str:
         return self._refresh_token
 
+    @property
+    def expires_at(self) -> int | None:
+        return self._expires_at
+
     @property
     def is_expired(self) -> bool:
+        return self.expires_within(0)
+
+    def expires_within(self, seconds: float) -> bool:
+        """Returns True if the token is already expired or will expire in the provided number of seconds."""
+
         if not self._expires_at:
             return True
 
-        return self._expires_at < time()
+        return self._expires_at < time() + seconds
 
     def serialize(self) -> str:
         """Serialize token object into a JSON string."""
@@ -66,4 +66,22 @@ class TestToken:
 
         is_expired = token.is_expired
 
-        assert is_expired == False
\ No newline at end of file
+        assert is_expired == False
+
+    async def test_expires_within__token_expiring_inside_window__returns_true(self):
+        token = Token({
+            "access_token": "12345",
+            "refresh_token": "abcde",
+            "expires_at": int(time()) + 30,
+        })
+
+        assert token.expires_within(60) == True
+
+    async def test_expires_within__token_expiring_outside_window__returns_false(self):
+        token = Token({
+            "access_token": "12345",
+            "refresh_token": "abcde",
+            "expires_at": int(time()) + 1000,
+        })
+
+        assert token.expires_within(60) == False
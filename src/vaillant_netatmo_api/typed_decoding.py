@@ -0,0 +1,184 @@
+"""Module containing typed decoding of the Netatmo API responses into the models, using msgspec structs validated while decoding."""
+
+# Annotations of the structs are evaluated by msgspec, so they use the typing generics which work on all the supported Python versions.
+from typing import List, Optional, Union
+
+import msgspec
+
+from .thermostat import (
+    Device,
+    Measured,
+    Module,
+    OutdoorTemperature,
+    Program,
+    Setpoint,
+    SystemMode,
+    TimeSlot,
+    Zone,
+)
+
+
+class _Zone(msgspec.Struct):
+    id: Optional[int] = None
+    name: str = ""
+    temp: float = 0.0
+    hw: bool = False
+
+
+class _TimeSlot(msgspec.Struct):
+    id: Optional[int] = None
+    m_offset: int = 0
+
+
+# Zones and time slots are built inline by the program, since calling a method per item costs more than building them.
+class _Program(msgspec.Struct):
+    program_id: Optional[str] = None
+    zones: List[_Zone] = msgspec.field(default_factory=list)
+    timetable: List[_TimeSlot] = msgspec.field(default_factory=list)
+    name: str = ""
+    selected: bool = False
+
+    def to_model(self) -> Program:
+        return Program.from_values(
+            self.program_id,
+            [Zone(zone.id, zone.name, zone.temp, zone.hw) for zone in self.zones],
+            [TimeSlot(time_slot.id, time_slot.m_offset) for time_slot in self.timetable],
+            self.name,
+            self.selected,
+        )
+
+
+class _Setpoint(msgspec.Struct):
+    setpoint_activate: bool = False
+    setpoint_endtime: Optional[int] = None
+    setpoint_temp: Optional[float] = None
+
+    def to_model(self) -> Setpoint:
+        return Setpoint(self.setpoint_activate, self.setpoint_endtime, self.setpoint_temp)
+
+
+class _Measured(msgspec.Struct):
+    temperature: Optional[float] = None
+    setpoint_temp: Optional[float] = None
+    est_setpoint_temp: Optional[float] = None
+
+    def to_model(self) -> Measured:
+        return Measured(self.temperature, self.setpoint_temp, self.est_setpoint_temp)
+
+
+class _OutdoorTemperature(msgspec.Struct):
+    te: Optional[float] = None
+    ti: Optional[int] = None
+
+    def to_model(self) -> OutdoorTemperature:
+        return OutdoorTemperature(self.te, self.ti)
+
+
+class _Module(msgspec.Struct):
+    id: Optional[str] = msgspec.field(default=None, name="_id")
+    type: str = ""
+    module_name: str = ""
+    firmware: Union[int, str] = 0
+    rf_status: int = 0
+    battery_percent: int = 0
+    setpoint_away: _Setpoint = msgspec.field(default_factory=_Setpoint)
+    setpoint_manual: _Setpoint = msgspec.field(default_factory=_Setpoint)
+    therm_program_list: List[_Program] = msgspec.field(default_factory=list)
+    measured: _Measured = msgspec.field(default_factory=_Measured)
+
+    def to_model(self) -> Module:
+        return Module.from_values(
+            self.id,
+            self.type,
+            self.module_name,
+            self.firmware,
+            self.rf_status,
+            self.battery_percent,
+            self.setpoint_away.to_model(),
+            self.setpoint_manual.to_model(),
+            [program.to_model() for program in self.therm_program_list],
+            self.measured.to_model(),
+        )
+
+
+class _Device(msgspec.Struct):
+    id: Optional[str] = msgspec.field(default=None, name="_id")
+    type: str = ""
+    station_name: str = ""
+    firmware: Union[int, str] = 0
+    wifi_status: int = 0
+    dhw: Optional[float] = None
+    dhw_max: Optional[float] = None
+    dhw_min: Optional[float] = None
+    setpoint_default_duration: Optional[int] = None
+    outdoor_temperature: _OutdoorTemperature = msgspec.field(default_factory=_OutdoorTemperature)
+    system_mode: Optional[str] = None
+    setpoint_hwb: _Setpoint = msgspec.field(default_factory=_Setpoint)
+    modules: List[_Module] = msgspec.field(default_factory=list)
+
+    def to_model(self) -> Device:
+        return Device.from_values(
+            self.id,
+            self.type,
+            self.station_name,
+            self.firmware,
+            self.wifi_status,
+            self.dhw,
+            self.dhw_max,
+            self.dhw_min,
+            self.setpoint_default_duration,
+            self.outdoor_temperature.to_model(),
+            SystemMode(self.system_mode),
+            self.setpoint_hwb.to_model(),
+            [module.to_model() for module in self.modules],
+        )
+
+
+class _ThermostatsData(msgspec.Struct):
+    devices: List[_Device] = msgspec.field(default_factory=list)
+
+
+class _Measurement(msgspec.Struct):
+    beg_time: Optional[int] = None
+    step_time: Optional[int] = None
+    value: List[List[Optional[float]]] = msgspec.field(default_factory=list)
+
+
+class ThermostatsDataResponse(msgspec.Struct):
+    """Typed response of the getthermostatsdata API call."""
+
+    status: str = ""
+    body: Optional[_ThermostatsData] = None
+
+    def to_devices(self) -> List[Device]:
+        """Returns the device models of the response."""
+
+        return [] if self.body is None else [device.to_model() for device in self.body.devices]
+
+
+class MeasureResponse(msgspec.Struct):
+    """Typed response of the getmeasure API call."""
+
+    status: str = ""
+    body: Optional[List[_Measurement]] = None
+
+    def to_measurement_rows(self) -> List[tuple]:
+        """Returns the begin time, the step and the rows of values of each measurement of the response."""
+
+        return [] if self.body is None else [(m.beg_time, m.step_time, m.value) for m in self.body]
+
+
+_THERMOSTATS_DATA_DECODER = msgspec.json.Decoder(ThermostatsDataResponse)
+_MEASURE_DECODER = msgspec.json.Decoder(MeasureResponse)
+
+
+def decode_thermostats_data(content: bytes) -> ThermostatsDataResponse:
+    """Decodes the content of a getthermostatsdata response. Throws msgspec.DecodeError if the content doesn't match the expected types."""
+
+    return _THERMOSTATS_DATA_DECODER.decode(content)
+
+
+def decode_measure(content: bytes) -> MeasureResponse:
+    """Decodes the content of a getmeasure response. Throws msgspec.DecodeError if the content doesn't match the expected types."""
+
+    return _MEASURE_DECODER.decode(content)
@@ -0,0 +1,20 @@
+import pytest
+
+pytest.importorskip("msgspec")
+
+from vaillant_netatmo_api.typed_decoding import decode_measure, decode_thermostats_data
+
+
+@pytest.mark.asyncio
+class TestTypedDecoding:
+    async def test_decode_thermostats_data__error_response__returns_status_without_devices(self):
+        response = decode_thermostats_data(b'{"error": {"code": 2, "message": "Invalid access token"}}')
+
+        assert response.status == ""
+        assert response.to_devices() == []
+
+    async def test_decode_measure__missing_values__returns_rows_with_none(self):
+        response = decode_measure(b'{"status": "ok", "body": [{"beg_time": 1000, "step_time": 300, "value": [[20], [null]]}]}')
+
+        assert response.status == "ok"
+        assert response.to_measurement_rows() == [(1000, 300, [[20.0], [None]])]